@@ -53,6 +53,11 @@ def register():
         else:
             print(f"⚠️ Module {module.__name__} does not have a register function")
 
+    # Reset runtime caches (mapping table, resolved datablocks) on file load
+    from .core.osc_server import _on_load_post
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
 def unregister():
     """
     Unregister the add-on.
@@ -71,9 +76,12 @@ def unregister():
     
     # Stop OSC server if active (safe-guard on import)
     try:
-        from .core.osc_server import stop_server
+        from .core.osc_server import stop_server, _on_load_post
 
         stop_server()
+
+        if _on_load_post in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(_on_load_post)
     except:
         # Avoid raising during add-on disable if server/core is not available
         pass
@@ -19,6 +19,74 @@ Low-level helpers for applying changes to Blender data:
 
 import bpy
 
+from array import array
+from typing import Any, Dict, Tuple
+
+
+# Axis -> component index lookup tables, hoisted to module scope so the
+# hot bone-update path does not rebuild a dict per call.
+# Quaternions are (w, x, y, z), Eulers are (x, y, z).
+_QIDX = {'X': 1, 'Y': 2, 'Z': 3}
+_EIDX = {'X': 0, 'Y': 1, 'Z': 2}
+
+# Values closer than this are considered unchanged; OSC sources often
+# stream identical values for idle channels at 60Hz+, and skipping the
+# write avoids the RNA setter, depsgraph tagging and autokey entirely.
+_EPSILON = 1e-6
+
+# Resolved Blender references memoized by name, so high-frequency streams
+# pay one Python dict lookup instead of three nested RNA dict lookups per
+# message. Keys are ('sk', obj_name, sk_name) and ('bone', arm_name, bone_name).
+_target_cache: Dict[Tuple, Any] = {}
+
+
+# Last value written by keyframe_insert per target, keyed like
+# ('sk', obj_name, sk_name) / ('bone', arm_name, bone_name, axis, mode).
+# Re-keying an unchanged value only duplicates the previous key, and
+# keyframe_insert is one of the most expensive RNA calls on these paths.
+_last_keyed: Dict[Tuple, float] = {}
+
+
+# Objects written to since the last flush_touched() call, keyed by name
+# so each object is tagged once per timer tick however many of its shape
+# keys or bones were updated.
+_touched: Dict[str, Any] = {}
+
+
+def invalidate_targets():
+    """
+    Drop all cached shape key / pose bone references.
+
+    Called when a new .blend file is loaded (load_post) and from
+    core/osc_server.invalidate_mapping_cache, since renamed or deleted
+    datablocks make the cached references stale.
+    """
+    _target_cache.clear()
+    _touched.clear()
+    _last_keyed.clear()
+
+
+def flush_touched():
+    """
+    Tag every object written since the last flush for depsgraph update.
+
+    update_tag only flags the object; the depsgraph integrates it on the
+    next redraw, which is much cheaper than the synchronous full
+    evaluation forced by view_layer.update(). Called once per tick by
+    the OSC timer after all apply_* calls.
+    """
+    if not _touched:
+        return
+
+    for obj in _touched.values():
+        try:
+            obj.update_tag(refresh={'OBJECT', 'DATA'})
+        except ReferenceError:
+            # The object was removed since the write; nothing to tag
+            pass
+
+    _touched.clear()
+
 
 # ------------------------------------------------------------------------------------------------------
 # Shape key utilities
@@ -66,18 +134,116 @@ def apply_shapekey_value(obj_name: str, sk_name: str, value: float) -> bool:
     Returns:
         True if the operation succeeded, False otherwise.
     """
-    obj, key, block = get_shapekey_block(obj_name, sk_name)
+    cache_key = ('sk', obj_name, sk_name)
+    cached = _target_cache.get(cache_key)
 
-    if block is None:
-        # Object or shape key not found
-        return False
+    if cached is not None:
+        obj, block = cached
+        try:
+            current = block.value
+        except ReferenceError:
+            # The datablock was removed; fall through to a fresh lookup
+            cached = None
+
+    if cached is None:
+        obj, key, block = get_shapekey_block(obj_name, sk_name)
+
+        if block is None:
+            # Object or shape key not found
+            return False
+
+        _target_cache[cache_key] = (obj, block)
+        current = block.value
+
+    # Skip redundant writes for idle channels streaming the same value
+    if abs(current - value) < _EPSILON:
+        return True
 
     # Apply the new shape key value    
     block.value = value
+    _touched[obj_name] = obj
+
+    # Optional auto-keying driven by the add-on (Scene property); skipped
+    # when the channel would just re-key its previous value
+    if bpy.context.scene.osc_autokey:
+        key = ('sk', obj_name, sk_name)
+        last = _last_keyed.get(key)
+        if last is None or abs(last - value) >= _EPSILON:
+            block.keyframe_insert(data_path="value", group="OSC")
+            _last_keyed[key] = value
 
-    # Optional auto-keying driven by the add-on (Scene property)
+    return True
+
+
+def apply_shapekey_values_bulk(obj_name: str, values: Dict[str, float]) -> bool:
+    """
+    Apply several shape key values on one mesh in a single batched write.
+
+    Instead of paying an RNA setter per key block, the current values are
+    read once with foreach_get into a float buffer, patched in Python,
+    and written back with a single foreach_set (Blender memcpys the
+    buffer since the type matches the float storage). Used by the OSC
+    timer when many keys of the same mesh update together, e.g. ARKit
+    face rigs streaming ~50 blendshapes per frame.
+
+    Args:
+        obj_name: Name of the mesh object that owns the shape keys.
+        values: Mapping of shape key name -> new value.
+
+    Returns:
+        True if at least one shape key was written, False otherwise.
+    """
+    obj = bpy.data.objects.get(obj_name)
+
+    if (
+        not obj
+        or not obj.data
+        or not hasattr(obj.data, "shape_keys")
+        or not obj.data.shape_keys
+    ):
+        return False
+
+    key_blocks = obj.data.shape_keys.key_blocks
+    count = len(key_blocks)
+
+    # Reuse a per-mesh float buffer sized to the key block count
+    buf_key = ('skbuf', obj_name)
+    buf = _target_cache.get(buf_key)
+    if buf is None or len(buf) != count:
+        buf = array('f', bytes(4 * count))
+        _target_cache[buf_key] = buf
+
+    key_blocks.foreach_get('value', buf)
+
+    # Patch only the requested indices, skipping unchanged channels
+    changed = []
+    for sk_name, value in values.items():
+        idx = key_blocks.find(sk_name)
+        if idx < 0:
+            continue
+        if abs(buf[idx] - value) < _EPSILON:
+            continue
+        buf[idx] = value
+        changed.append((idx, sk_name, value))
+
+    if not changed:
+        return False
+
+    key_blocks.foreach_set('value', buf)
+    # foreach_set bypasses the RNA setters, so the depsgraph tag must be
+    # requested explicitly via the touched set
+    _touched[obj_name] = obj
+
+    # Optional auto-keying, inserted after the batched write so the
+    # keyframes pick up the new values; channels that would re-key their
+    # previous value are skipped
     if bpy.context.scene.osc_autokey:
-        block.keyframe_insert(data_path="value", group="OSC")
+        for idx, sk_name, value in changed:
+            key = ('sk', obj_name, sk_name)
+            last = _last_keyed.get(key)
+            if last is None or abs(last - value) >= _EPSILON:
+                key_blocks[idx].keyframe_insert(data_path="value", group="OSC")
+                _last_keyed[key] = value
 
     return True
 
@@ -111,36 +277,65 @@ def apply_bone_rotation(
         True if the rotation was applied, False if the target object/bone
         could not be found or was invalid.
     """
-    print(f"Applying rotation to {armature_name}.{bone_name} axis {axis} = {value} mode {mode}")
+    cache_key = ('bone', armature_name, bone_name)
+    cached = _target_cache.get(cache_key)
 
-    obj = bpy.data.objects.get(armature_name)
+    if cached is not None:
+        obj, pb = cached
+        try:
+            pb.rotation_mode
+        except ReferenceError:
+            # The armature or bone was removed; fall through to a fresh lookup
+            cached = None
 
-    # Ensure we found a valid armature object with pose data
-    if not obj or obj.type != 'ARMATURE' or not obj.pose:
-        return False
+    if cached is None:
+        obj = bpy.data.objects.get(armature_name)
 
-    pb = obj.pose.bones.get(bone_name)
-    if not pb:
-        return False
+        # Ensure we found a valid armature object with pose data
+        if not obj or obj.type != 'ARMATURE' or not obj.pose:
+            return False
+
+        pb = obj.pose.bones.get(bone_name)
+        if not pb:
+            return False
+
+        _target_cache[cache_key] = (obj, pb)
     
     if mode == 'QUATERNION':
-        # Copy the current quaternion and override a single component
-        q = pb.rotation_quaternion.copy()
-        idx = {'X': 1, 'Y': 2, 'Z': 3}[axis]
-        q[idx] = value
-        pb.rotation_quaternion = q
+        # Write the single component in place; item assignment goes through
+        # the RNA setter directly, so no Quaternion copy is needed.
+        idx = _QIDX[axis]
+
+        # Skip redundant writes when the component did not change
+        if abs(pb.rotation_quaternion[idx] - value) < _EPSILON:
+            return True
+
+        pb.rotation_quaternion[idx] = value
+        _touched[armature_name] = obj
 
         if bpy.context.scene.osc_autokey:
-            pb.keyframe_insert(data_path="rotation_quaternion", group="OSC")
+            key = ('bone', armature_name, bone_name, axis, mode)
+            last = _last_keyed.get(key)
+            if last is None or abs(last - value) >= _EPSILON:
+                pb.keyframe_insert(data_path="rotation_quaternion", group="OSC")
+                _last_keyed[key] = value
 
     else:
         # Default to Euler rotation (mode 'EULER' or anything else)
-        e = pb.rotation_euler.copy()
-        idx = {'X': 0, 'Y': 1, 'Z': 2}[axis]
-        e[idx] = value
-        pb.rotation_euler = e
+        idx = _EIDX[axis]
+
+        # Skip redundant writes when the component did not change
+        if abs(pb.rotation_euler[idx] - value) < _EPSILON:
+            return True
+
+        pb.rotation_euler[idx] = value
+        _touched[armature_name] = obj
 
         if bpy.context.scene.osc_autokey:
-            pb.keyframe_insert(data_path="rotation_euler", group="OSC")
+            key = ('bone', armature_name, bone_name, axis, mode)
+            last = _last_keyed.get(key)
+            if last is None or abs(last - value) >= _EPSILON:
+                pb.keyframe_insert(data_path="rotation_euler", group="OSC")
+                _last_keyed[key] = value
             
     return True
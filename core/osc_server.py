@@ -19,9 +19,9 @@ Management of the OSC (threaded) server used by the add-on:
 import bpy
 import sys
 import os
+import selectors
 import threading
-import queue
-import time
+from collections import deque
 from typing import Dict, Optional, List, Tuple
 
 # ------------------------------------------------------------------------------------------------------
@@ -32,17 +32,46 @@ from typing import Dict, Optional, List, Tuple
 ADDON_ROOT = os.path.dirname(os.path.dirname(__file__))  # parent of "core"
 VENDOR_DIR = os.path.join(ADDON_ROOT, "vendors")
 
-if VENDOR_DIR not in sys.path:
-    sys.path.insert(0, VENDOR_DIR)
 
-try:
-    # Import from the bundled python-osc copied into vendors/pythonosc
-    from pythonosc.dispatcher import Dispatcher
-    from pythonosc.osc_server import ThreadingOSCUDPServer
-except Exception as e:
-    print("python-osc import error:", e)
-    Dispatcher = None
-    ThreadingOSCUDPServer = None
+def __getattr__(name):
+    """
+    PEP 562 lazy loader for the bundled python-osc classes.
+
+    'Dispatcher' and 'ThreadingOSCUDPServer' are only imported (and the
+    vendors directory only added to sys.path) on first access, so simply
+    enabling the add-on does not pay the python-osc parse cost. On import
+    failure both names resolve to None, which start_server reports.
+    """
+    if name in ("Dispatcher", "ThreadingOSCUDPServer"):
+        if VENDOR_DIR not in sys.path:
+            sys.path.insert(0, VENDOR_DIR)
+
+        try:
+            # Import from the bundled python-osc copied into vendors/pythonosc
+            from pythonosc.dispatcher import Dispatcher
+            from pythonosc.osc_server import ThreadingOSCUDPServer
+        except Exception as e:
+            print("python-osc import error:", e)
+            Dispatcher = None
+            ThreadingOSCUDPServer = None
+
+        globals()["Dispatcher"] = Dispatcher
+        globals()["ThreadingOSCUDPServer"] = ThreadingOSCUDPServer
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _ensure_pythonosc():
+    """
+    Resolve (Dispatcher, ThreadingOSCUDPServer), importing them on first use.
+
+    Plain global lookups inside functions bypass the module __getattr__
+    hook, so this helper triggers it explicitly.
+    """
+    if "Dispatcher" not in globals():
+        __getattr__("Dispatcher")
+    return globals()["Dispatcher"], globals()["ThreadingOSCUDPServer"]
 
 
 # ------------------------------------------------------------------------------------------------------
@@ -50,8 +79,21 @@ except Exception as e:
 # ------------------------------------------------------------------------------------------------------
 
 from .mapping import build_mapping_table_extended
-from .data_utils import apply_shapekey_value, apply_bone_rotation
-from .property_handler import apply_generic_value
+from .data_utils import (
+    apply_shapekey_value,
+    apply_shapekey_values_bulk,
+    apply_bone_rotation,
+    flush_touched,
+    invalidate_targets,
+)
+from .property_handler import (
+    apply_generic_value,
+    invalidate_camera_users,
+    invalidate_keyframe_state,
+    invalidate_resolved_sockets,
+    _osc_begin_session,
+    _osc_end_session,
+)
 
 
 # ------------------------------------------------------------------------------------------------------
@@ -66,19 +108,96 @@ class OSCState:
         server_thread: Background thread running the OSC server loop.
         server: The underlying ThreadingOSCUDPServer instance.
         dispatcher: python-osc Dispatcher routing incoming messages.
-        msg_queue: Thread-safe queue of (address, args) tuples to be processed by Blender's main thread.
+        msg_queue: Bounded deque of fully-resolved update tuples to be
+            applied by Blender's main thread (value always last).
+            deque.append/popleft are atomic, so the single OSC producer
+            and the single timer consumer need no extra locking; maxlen
+            drops the oldest entries under overload.
+        table: Read-only snapshot of the mapping table for the OSC thread.
+            Replaced atomically on the main thread, never mutated in place.
         running: Flag indicating whether the OSC server loop should keep running
+        debug: When True, log every incoming OSC message to the console.
+            Off by default: synchronous stdout writes per message are a
+            real cost at typical OSC rates (200+ Hz).
     """
     server_thread: Optional[threading.Thread] = None
-    server: Optional[ThreadingOSCUDPServer] = None
-    dispatcher: Optional[Dispatcher] = None
-    msg_queue: "queue.Queue[Tuple[str, List[float]]]" = queue.Queue()
+    server: "Optional[ThreadingOSCUDPServer]" = None
+    dispatcher: "Optional[Dispatcher]" = None
+    msg_queue: "deque[Tuple]" = deque(maxlen=4096)
+    table: Dict[str, List] = {}
     running: bool = False
+    debug: bool = False
 
 # Single global state instance used by the add-on
 osc_state = OSCState()
 
 
+# ------------------------------------------------------------------------------------------------------
+# Mapping table cache
+# ------------------------------------------------------------------------------------------------------
+
+# Cached mapping table and the signature of the scene collections it was
+# built from. Rebuilding the table on every timer tick re-iterates all
+# mapping PropertyGroups and re-allocates every mapping object, which is
+# pure overhead when nothing has changed.
+_cached_table: Optional[Dict[str, List]] = None
+_cached_sig: Optional[Tuple[int, int]] = None
+
+
+def invalidate_mapping_cache():
+    """
+    Drop the cached mapping table.
+
+    Called by the mapping CRUD operators and by the property update
+    callbacks in properties/scene_props.py whenever a mapping is added,
+    removed or edited, so the next timer tick rebuilds the table.
+    """
+    global _cached_table, _cached_sig
+    _cached_table = None
+    _cached_sig = None
+
+    # Cached Blender references follow the same lifecycle as the table
+    invalidate_targets()
+
+
+@bpy.app.handlers.persistent
+def _on_load_post(_dummy):
+    """
+    load_post handler: reset all runtime caches when a .blend is loaded.
+
+    Registered by the add-on's main register() function. Cached mapping
+    tables and resolved datablock references from the previous file would
+    otherwise go stale.
+    """
+    invalidate_mapping_cache()
+    invalidate_camera_users()
+    invalidate_resolved_sockets()
+    invalidate_keyframe_state()
+
+
+def _get_mapping_table(ctx) -> Dict[str, List]:
+    """
+    Return the mapping table for the current scene, rebuilding it only
+    when the mapping collections changed since the last call.
+
+    The signature only tracks collection lengths (add/remove); edits of
+    individual mapping fields go through invalidate_mapping_cache() via
+    the property update callbacks.
+    """
+    global _cached_table, _cached_sig
+
+    scene = ctx.scene
+    sig = (len(scene.osc_mappings), len(scene.osc_generic_mappings))
+
+    if _cached_table is None or sig != _cached_sig:
+        _cached_table = build_mapping_table_extended(ctx)
+        _cached_sig = sig
+        # Publish a fresh snapshot for the OSC thread (atomic reference swap)
+        osc_state.table = _cached_table
+
+    return _cached_table
+
+
 # ------------------------------------------------------------------------------------------------------
 # OSC message handler (called from the OSC thread)
 # ------------------------------------------------------------------------------------------------------
@@ -87,27 +206,112 @@ def osc_handler(address, *args):
     """
     Default handler called by python-osc for every incoming OSC message.
 
-    This function runs in the OSC server thread, so it must be very fast
-    and never touch Blnder data directly. It only pushes messages into
-    a thread-safe queue to be processed later on the main thread.
+    This function runs in the OSC server thread and must never touch
+    Blender data directly. It resolves the address against the read-only
+    mapping table snapshot, remaps the value, and queues fully-resolved
+    update tuples (value last) so the main-thread timer only has to
+    execute the apply_* calls. This keeps the pure-Python mapping work
+    off Blender's main thread.
 
     Args:
         address: OSC address string (e.g. '/osc/shape/Smile).
         *args: Variable-length list of OSC arguments (numbers, strings, etc.).
     """
-    print(f"OSC MESSAGE: {address} {args}")
-    try:
-        # Store the message in the queue as (address, list_of_args)
-        osc_state.msg_queue.put_nowait((address, list(args)))
-    except queue.Full:
-        # If the queue is full, silently drop the message to avoid blocking
-        pass
+    # Optional tracing only; console I/O per message is too slow to leave on
+    if osc_state.debug:
+        print(f"OSC MESSAGE: {address} {args}")
+
+    # Single dict lookup, done first: unmapped addresses (the common case
+    # when several OSC apps share one port) bail out before touching args.
+    entries = osc_state.table.get(address)
+    if not entries:
+        return
+
+    # OSC payloads almost always carry the numeric as the first argument,
+    # so try that in one index op before scanning the rest.
+    if args and isinstance(args[0], (float, int)):
+        value = float(args[0])
+    else:
+        # args[0] already failed the check above, so scan from the second
+        # argument; non-numeric payloads are dropped here, once, and the
+        # timer only ever sees native floats.
+        value = None
+        for a in args[1:]:
+            if isinstance(a, (float, int)):
+                value = float(a)
+                break
+
+        if value is None:
+            return
+
+    q = osc_state.msg_queue
+
+    # Table entries are flat (kind, *target, scale, bias, lo, hi) tuples
+    # built in core/mapping.build_mapping_table_extended. The affine remap
+    # is inlined here — no mapping object, no closure call — and dropping
+    # the four scalars while appending the result yields exactly the
+    # update tuple the timer expects. lo/hi are +/-inf for unclamped
+    # mappings, so the clamp needs no flag test.
+    for entry in entries:
+        v = value * entry[-4] + entry[-3]
+        if v < entry[-2]:
+            v = entry[-2]
+        elif v > entry[-1]:
+            v = entry[-1]
+        q.append(entry[:-4] + (v,))
+
+
+def apply_bundle(pairs):
+    """
+    Queue a batch of (address, value) updates in one call.
+
+    python-osc already unwraps incoming #bundle packets into one
+    osc_handler call per contained message, so bundled network traffic
+    takes the batched queue/timer path automatically; this helper gives
+    scripted or main-thread callers the same semantics. Each pair goes
+    through the normal table lookup and remap, the timer applies the
+    whole batch within one tick, and a single throttled redraw request
+    covers the lot.
+    """
+    for address, value in pairs:
+        osc_handler(address, value)
+
+    # Imported lazily: core must not pull the UI package in at import time
+    from ..ui.panels import request_redraw
+    request_redraw()
 
 
 # ------------------------------------------------------------------------------------------------------
 # Server lifecycle management
 # ------------------------------------------------------------------------------------------------------
 
+# Callables invoked with the new running state on every start/stop
+# transition (always from the main thread, since start_server and
+# stop_server run in operators). osc_state.running is a plain Python
+# attribute, not RNA, so listeners stand in for a msgbus subscription:
+# ui/panels registers one to cache the state and refresh its button row.
+_state_listeners = []
+
+
+def add_state_listener(fn):
+    """Register fn(running: bool) to be called on server start/stop."""
+    if fn not in _state_listeners:
+        _state_listeners.append(fn)
+
+
+def remove_state_listener(fn):
+    """Remove a listener added with add_state_listener."""
+    try:
+        _state_listeners.remove(fn)
+    except ValueError:
+        pass
+
+
+def _notify_state(running: bool):
+    for fn in _state_listeners:
+        fn(running)
+
+
 def start_server(ip: str, port: int) -> Optional[str]:
     """
     Start the OSC UDP server in a dedicated background thread.
@@ -126,7 +330,10 @@ def start_server(ip: str, port: int) -> Optional[str]:
     # Prevent starting two servers at the same time
     if osc_state.running:
         return "Server already started."
-    
+
+    # Lazily import the bundled python-osc on first server start
+    Dispatcher, ThreadingOSCUDPServer = _ensure_pythonosc()
+
     # If python-osc could not be imported, we cannot start the server
     if Dispatcher is None or ThreadingOSCUDPServer is None:
         return "python-osc could not be imported (check addon vendors folder)"
@@ -136,34 +343,50 @@ def start_server(ip: str, port: int) -> Optional[str]:
         disp = Dispatcher()
         disp.set_default_handler(osc_handler, needs_reply_address=False)
         
-        # Create the UDP server with a very small timeout so handle_request()
-        # does not block for long (better responsiveness in the thread loop).
+        # Create the UDP server; readiness is handled by the selector in
+        # serve(), so no sub-millisecond socket timeout is needed anymore.
         server = ThreadingOSCUDPServer((ip, port), disp)
-        server.timeout = 0.0001
-        
+
         # Additional socket options to improve stability and thtoughput.
         import socket
         server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         # 1MB receive buffer to better handle bursts of OSC messages
         server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1048576)
-        server.socket.settimeout(0.0001)
-        
+
         def serve():
             """
             Main loop running in the background thread.
 
-            It repeatedly calls server.handle_request() while osc_state.running
-            is True, and the closes the server when the loop exists.
+            It blocks on a selector until the socket is readable (or the
+            0.05s timeout elapses to re-check osc_state.running), and only
+            then calls server.handle_request(). Compared to spinning on a
+            0.0001s socket timeout and swallowing the resulting OSError
+            ~10000 times per second, an idle server now costs one select
+            syscall per wakeup and essentially no CPU.
             """
             print("🚀 OSC server started !")
-            while osc_state.running:
-                try:
-                    server.handle_request()
-                except:
-                    # Ignore timeouts and any non-fatal socket errors
-                    continue  
-            # Gracefully close the underlying socket
-            server.server_close()
+
+            sel = selectors.DefaultSelector()
+            sel.register(server.socket, selectors.EVENT_READ)
+
+            try:
+                while osc_state.running:
+                    try:
+                        if sel.select(timeout=0.05):
+                            server.handle_request()
+                    except OSError:
+                        # Ignore non-fatal socket errors
+                        continue
+            finally:
+                sel.close()
+                # Gracefully close the underlying socket
+                server.server_close()
+
+        # Snapshot the mapping table before the OSC thread starts reading it
+        _get_mapping_table(bpy.context)
+
+        # Cheap keyframing preferences for the whole session (restored on stop)
+        _osc_begin_session()
 
         # Store dispatcher and server in the global state
         osc_state.dispatcher = disp
@@ -174,7 +397,9 @@ def start_server(ip: str, port: int) -> Optional[str]:
         t = threading.Thread(target=serve, daemon=True)
         t.start()
         osc_state.server_thread = t
-        
+
+        _notify_state(True)
+
         return None
         
     except OSError as e:
@@ -190,29 +415,42 @@ def stop_server():
     Stop the OSC server and clean up all runtime state.
 
     This can be called from a Blender operator or on add-on unregister().
-    It signals the background thread to stop, waits a short time, and clears
-    the message queue.
+    It signals the background thread to stop, joins it, and clears the
+    message queue.
     """
     if not osc_state.running:
         return
-    
+
     # Signal the background thread to exit its loop
     osc_state.running = False
 
-    # Give th thread a small amount of time to shut down cleanly
-    try:
-        time.sleep(0.25)
-    except:
-        pass
+    # Close the socket so a select/handle_request blocked in the serve
+    # loop returns immediately instead of waiting out its timeout
+    if osc_state.server is not None:
+        try:
+            osc_state.server.server_close()
+        except OSError:
+            pass
+
+    # Join with a bounded timeout: this returns as soon as the thread
+    # actually exits (typically ~1ms) rather than always blocking the UI
+    # for a fixed sleep
+    t = osc_state.server_thread
+    if t is not None:
+        t.join(timeout=0.25)
+
+    # Restore the user's keyframing preferences
+    _osc_end_session()
 
     # restart server-related state
     osc_state.server = None
     osc_state.server_thread = None
     osc_state.dispatcher = None
     
-    # Clear any remaining messages in the queue
-    with osc_state.msg_queue.mutex:
-        osc_state.msg_queue.queue.clear()
+    # Clear any remaining updates in the queue
+    osc_state.msg_queue.clear()
+
+    _notify_state(False)
 
 
 # ------------------------------------------------------------------------------------------------------
@@ -226,10 +464,13 @@ def osc_timer_step_extended() -> Optional[float]:
     This function is expected to be called regularly from Blender's main
     thread (for example via bpy.app.timers). It:
 
-    - Read messages from the thread-safe queue
-    - Resolves them to the corresponding OSC mappings
+    - Refreshes the mapping table snapshot used by the OSC thread
+    - Reads fully-resolved update tuples from the thread-safe queue
     - Applies all changes at once (shape keys, bones, generic properties)
-    - Triggers a single view layer update
+    - Tags each touched object once for depsgraph update
+
+    Mapping resolution and value remapping already happened in the OSC
+    thread (see osc_handler), so the timer only executes apply_* calls.
 
     Returns:
         A float delay (in seconds) for the next timer call, or None to stop.
@@ -238,80 +479,57 @@ def osc_timer_step_extended() -> Optional[float]:
         # If the server is not running, the timer can optionnaly stop
         return None
 
-    # Build the mapping table for the current scene/context
-    table = build_mapping_table_extended(bpy.context)
+    # Keep the mapping table snapshot fresh for the OSC thread
+    _get_mapping_table(bpy.context)
 
-    processed = 0
-    max_per_tick = 100 # Safety limit: number of messages processed per tick
+    max_per_tick = 100 # Safety limit: number of updates processed per tick
 
-    # Collect all messages whithout applying them yet
-    messages_batch: List[Tuple[str, List[float]]] = []
+    # Drain up to max_per_tick updates; deque.popleft is atomic, so no
+    # lock is needed between the OSC producer and this consumer.
+    q = osc_state.msg_queue
+    n = min(len(q), max_per_tick)
+    updates_to_apply: List[Tuple] = [q.popleft() for _ in range(n)]
 
-    while not osc_state.msg_queue.empty() and processed < max_per_tick:
-        try:
-            address, args = osc_state.msg_queue.get_nowait()
-            messages_batch.append((address, args))
-            processed += 1
-        except queue.Empty:
-            break
-    
-    # If there are no messages, we can sleep for a short time.
-    if not messages_batch:
+    # If there are no updates, we can sleep for a short time.
+    if not updates_to_apply:
         return 0.01
 
-    # Prepare a list of concrete updates to apply to Blender data
-    updates_to_apply: List[Tuple] = []
+    # Coalesce repeated updates for the same target within this tick:
+    # only the newest value matters, so a fast OSC source hammering one
+    # channel costs a single apply_* call instead of one per message.
+    # Update tuples always carry the value last, so everything before it
+    # identifies the target.
+    latest: Dict[Tuple, float] = {}
+    for update in updates_to_apply:
+        latest[update[:-1]] = update[-1]
+
+    if len(latest) < len(updates_to_apply):
+        updates_to_apply = [target + (value,) for target, value in latest.items()]
+
+    # Bucket shape key updates per mesh: a facial rig streaming many
+    # blendshapes at once can then go through the batched foreach_set
+    # path instead of one RNA setter per key.
+    shapekey_buckets: Dict[str, Dict[str, float]] = {}
+    for update in updates_to_apply:
+        if update[0] == 'shapekey':
+            shapekey_buckets.setdefault(update[1], {})[update[2]] = update[3]
 
-    for address, args in messages_batch:
-        value = None
-
-        # Find the first numeric argument in the OSC message
-        for a in args:
-            if isinstance(a, (float, int)):
-                value = float(a)
-                break
-
-        if value is not None and address in table:
-            # Import here to avoid circular imports at module level
-            from .mapping import OSCMapping, GenericOSCMapping
-
-            # For each mapping registered on this OSC address
-            for m in table[address]:
-                v = m.map_value(value)
-                
-                if isinstance(m, OSCMapping):
-                    # Shape key mapping
-                    if m.shapekey_name:
-                        updates_to_apply.append(
-                            ('shapekey', m.object_name, m.shapekey_name, v)
-                        )
-                    # Bone rotation mapping
-                    if m.bone_name and m.armature_name:
-                        updates_to_apply.append(
-                            (
-                                'bone', 
-                                m.armature_name, 
-                                m.bone_name, 
-                                m.rotation_axis, 
-                                v, 
-                                m.rotation_mode)
-                        )
-                        
-                elif isinstance(m, GenericOSCMapping):
-                    # Generic data path mapping (timeline, modifiers, node props, etc.)
-                    updates_to_apply.append(
-                        ('generic', m.data_path, v)
-                     )
-    
     # Apply all collected changes in a single pass
     try:
+        for object_name, sk_values in shapekey_buckets.items():
+            if len(sk_values) >= 4:
+                apply_shapekey_values_bulk(object_name, sk_values)
+            else:
+                for shapekey_name, value in sk_values.items():
+                    apply_shapekey_value(object_name, shapekey_name, value)
+
         for update in updates_to_apply:
             if update[0] == 'shapekey':
-                _, object_name, shapekey_name, value = update
-                apply_shapekey_value(object_name, shapekey_name, value)
+                # Already applied through the per-mesh buckets above
+                continue
 
             elif update[0] == 'bone':
-                _, armature_name, bone_name, rotation_axis, value, rotation_mode = update
+                _, armature_name, bone_name, rotation_axis, rotation_mode, value = update
                 apply_bone_rotation(
                     armature_name, 
                     bone_name, 
@@ -324,9 +542,10 @@ def osc_timer_step_extended() -> Optional[float]:
                 _, data_path, value = update
                 apply_generic_value(data_path, value)
 
-        # One single scene update for all changes (better for performance)
-        if updates_to_apply:
-            bpy.context.view_layer.update()
+        # Tag each touched object once for depsgraph update; the next
+        # redraw integrates them without a forced synchronous evaluation
+        # of the whole view layer.
+        flush_touched()
     
     except Exception as e:
         # Catch any unexpected error during application to avoid killing the timer
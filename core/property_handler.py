@@ -28,8 +28,719 @@ osc_server.py, which calls this function for GenericOSCMapping entries.
 import bpy
 import re
 
+from functools import lru_cache
+
+
+# Gate for the informational prints on the success path. Formatting and
+# writing an f-string per applied value is measurable at OSC rates, so
+# tracing is opt-in; error prints stay unconditional.
+_DEBUG = False
+
+
+# Compiled once at import: apply_generic_value runs per OSC message, and
+# recompiling (or re-hashing into re's internal cache) the same patterns
+# on every call is measurable at controller rates.
+
+# node name (double or single quoted) + input index of a shader/node socket
+_SHADER_NODE_RE = re.compile(
+    r'nodes\[(?:\"([^\"]+)\"|\'([^\']+)\')\]\.inputs\[(\d+)\]\.default_value'
+)
+
+# material or texture name in bpy.data.materials['...'] / textures['...']
+_MAT_TEX_NAME_RE = re.compile(r"(?:materials|textures)\['([^']+)'\]")
+
+# node group name in bpy.data.node_groups['...']
+_NG_NAME_RE = re.compile(r"node_groups\['([^']+)'\]")
+
+# trailing array index on a relative path, e.g. "location[0]"
+_INDEX_RE = re.compile(r'(.+)\[(\d+)\]$')
+
+# simple property name with index, e.g. "rotation_euler[2]"
+_ARRAY_PROP_RE = re.compile(r'(\w+)\[(\d+)\]')
+
+# collection + datablock name of a generic path, e.g. "bpy.data.objects['Cube']";
+# the remainder (".location[0]", "['prop']", ...) follows the match end
+_GENERIC_RE = re.compile(r"bpy\.data\.(\w+)\['([^']+)'\]")
+
+
+# ------------------------------------------------------------------------------------------------------
+# Parsed-path assignment (replaces exec on the hot path)
+# ------------------------------------------------------------------------------------------------------
+
+@lru_cache(maxsize=512)
+def _parse_path(data_path):
+    """
+    Tokenize a 'bpy.*' data path into resolvable segments.
+
+    Returns a tuple of ('attr', name) / ('item', key) operations, where
+    key is a str for quoted keys and an int for numeric indices, or None
+    if the path contains something the tokenizer does not understand.
+
+    Cached: the same mapping fires on every incoming message, so steady
+    state is one dict lookup instead of re-parsing the string. The cache
+    is keyed purely on the string, so it never goes stale across files.
+    """
+    ops = []
+    i = 0
+    n = len(data_path)
+
+    while i < n:
+        c = data_path[i]
+
+        if c == '.':
+            i += 1
+
+        elif c == '[':
+            # Bracketed access: quoted string key or integer index
+            j = i + 1
+            if j < n and data_path[j] in '"\'':
+                quote = data_path[j]
+                k = data_path.find(quote, j + 1)
+                if k < 0 or k + 1 >= n or data_path[k + 1] != ']':
+                    return None
+                ops.append(('item', data_path[j + 1:k]))
+                i = k + 2
+            else:
+                k = data_path.find(']', j)
+                if k < 0:
+                    return None
+                try:
+                    ops.append(('item', int(data_path[j:k])))
+                except ValueError:
+                    return None
+                i = k + 1
+
+        else:
+            # Plain attribute name up to the next '.' or '[', both
+            # located with C-level str.find instead of a char loop
+            j = data_path.find('.', i)
+            k = data_path.find('[', i)
+            if j < 0 or 0 <= k < j:
+                j = k
+            if j < 0:
+                j = n
+            name = data_path[i:j]
+            if not name.isidentifier():
+                return None
+            ops.append(('attr', name))
+            i = j
+
+    if len(ops) < 2 or ops[0] != ('attr', 'bpy'):
+        return None
+
+    return tuple(ops)
+
+
+@lru_cache(maxsize=1024)
+def _compile_assign(data_path: str):
+    """
+    Compile the exec-fallback assignment for data_path once.
+
+    The fallback still goes through exec, but the lexer/parser/compiler
+    pass only runs on first sight of a path: the cached code object
+    assigns the value passed in via the '__v__' global, so repeat
+    messages just execute a couple of LOAD/STORE opcodes. Keyed purely
+    on the string, so entries never go stale across files.
+    """
+    return compile(f"{data_path} = __v__", "<osc>", "exec")
+
+
+def _resolve_path(data_path: str):
+    """
+    Resolve a 'bpy.*' path to the object it denotes, without eval.
+
+    eval(obj_path) compiles and executes a fresh expression per call;
+    this walks the cached tokens from _parse_path instead. Returns None
+    when the path cannot be tokenized (caller may fall back to eval);
+    resolution errors raise, exactly like the eval they replace.
+    """
+    ops = _parse_path(data_path)
+    if ops is None:
+        return None
+
+    obj = bpy
+    for op, arg in ops[1:]:
+        if op == 'attr':
+            obj = getattr(obj, arg)
+        else:
+            obj = obj[arg]
+
+    return obj
+
+
+def _resolve_and_assign(data_path: str, value) -> bool:
+    """
+    Assign value to the property described by data_path without exec.
+
+    exec(f"{data_path} = {value}") re-parses, compiles and executes a
+    fresh source string per call — by far the dominant cost of applying a
+    generic mapping. This walks the pre-parsed tokens with getattr/item
+    lookups instead.
+
+    Returns False when the path cannot be tokenized (caller may fall back
+    to exec for exotic paths); resolution errors raise, exactly like the
+    exec they replace, so the surrounding error handling is unchanged.
+    """
+    ops = _parse_path(data_path)
+    if ops is None:
+        return False
+
+    obj = bpy
+    for op, arg in ops[1:-1]:
+        if op == 'attr':
+            obj = getattr(obj, arg)
+        else:
+            obj = obj[arg]
+
+    op, arg = ops[-1]
+    if op == 'attr':
+        setattr(obj, arg, value)
+    else:
+        obj[arg] = value
+
+    return True
+
+
+# ------------------------------------------------------------------------------------------------------
+# Cached branch classification
+# ------------------------------------------------------------------------------------------------------
+
+# Branch ids returned by _classify, in the order the original if-ladder
+# tested its conditions (the order matters: e.g. bpy.data modifier paths
+# must keep hitting the generic bpy.data branch).
+_B_INVALID = 0
+_B_TIMELINE = 1
+_B_PLAYBACK = 2
+_B_SHADER_NODE = 3
+_B_NODE_GROUP = 4
+_B_BPY_DATA = 5
+_B_MODIFIER = 6
+_B_GN_EDITOR = 7
+_B_CLASSIC = 8
+
+
+@lru_cache(maxsize=512)
+def _classify(data_path: str) -> int:
+    """
+    Decide which apply_generic_value branch handles this data_path.
+
+    The same mapping fires on every incoming message, so re-running the
+    whole substring ladder per call is wasted work: cached, the steady
+    state cost is one dict lookup. Classification depends only on the
+    string itself, so the cache never goes stale across .blend files.
+    """
+    if not data_path.startswith('bpy.'):
+        return _B_INVALID
+
+    if 'frame_current' in data_path:
+        return _B_TIMELINE
+
+    if 'is_animation_playing' in data_path:
+        return _B_PLAYBACK
+
+    # The remaining tests share two tokens; scan for those once and gate
+    # the stricter checks on the results, so a typical path is classified
+    # in a couple of substring scans instead of one per branch.
+    has_nodes = '.nodes[' in data_path
+    has_bpy_data = 'bpy.data.' in data_path
+
+    if has_nodes and has_bpy_data:
+        if (
+            '.node_tree.nodes[' in data_path
+            and (
+                'bpy.data.materials[' in data_path
+                or 'bpy.data.textures[' in data_path
+            )
+        ):
+            return _B_SHADER_NODE
+
+        if 'bpy.data.node_groups[' in data_path and '.inputs[' in data_path:
+            return _B_NODE_GROUP
+
+    if has_bpy_data:
+        return _B_BPY_DATA
+
+    if '.modifiers[' in data_path and '][' in data_path:
+        return _B_MODIFIER
+
+    if has_nodes and '.node_groups[' in data_path:
+        return _B_GN_EDITOR
+
+    return _B_CLASSIC
+
+
+# Action-name suffix by datablock type name; one type() + dict lookup
+# replaces chained isinstance checks against bpy RNA types. Light
+# datablocks are concrete subclasses, hence the four light entries.
+_ACTION_SUFFIX = {
+    "Camera": "_CameraAction",
+    "Light": "_LightAction",
+    "PointLight": "_LightAction",
+    "SunLight": "_LightAction",
+    "SpotLight": "_LightAction",
+    "AreaLight": "_LightAction",
+}
+
+
+# RNA property kind per (type name, property name): ('FLOAT', 3) for
+# location, ('BOOLEAN', 0) for hide_viewport, (None, 0) for custom or
+# unknown properties. RNA layouts are fixed per registered type, so the
+# cache never needs invalidating.
+_PROP_KIND = {}
+
+
+def _prop_kind(obj, prop_name: str):
+    """
+    Return (kind, array_length) for a property of obj, cached per type.
+
+    Lets the classical branch pick the bool/array/scalar assignment
+    without fetching the current value first — getattr on a vector
+    property copies the whole array into a Python wrapper per call.
+    """
+    key = (type(obj).__name__, prop_name)
+    cached = _PROP_KIND.get(key)
+
+    if cached is None:
+        prop = obj.bl_rna.properties.get(prop_name)
+        if prop is None:
+            cached = (None, 0)
+        else:
+            cached = (prop.type, getattr(prop, 'array_length', 0))
+        _PROP_KIND[key] = cached
+
+    return cached
+
+
+# ------------------------------------------------------------------------------------------------------
+# Camera users reverse index
+# ------------------------------------------------------------------------------------------------------
+
+# Lazily built reverse index: camera datablock -> objects using it, plus
+# the scene object count it was built from. Tagging a camera datablock
+# used to scan every scene object per message, which is O(n_objects).
+_camera_users = None
+_camera_users_sig = -1
+
+
+def invalidate_camera_users():
+    """
+    Drop the camera reverse index (called on file load from
+    core/osc_server._on_load_post, with the other runtime caches).
+    """
+    global _camera_users
+    _camera_users = None
+
+
+def _camera_users_for(cam_data):
+    """
+    Return the scene objects using cam_data, via the reverse index.
+
+    The index is rebuilt lazily when missing or when the scene object
+    count changed (objects added/removed), so the steady-state cost per
+    message is a single dict lookup instead of a full scene scan.
+    """
+    global _camera_users, _camera_users_sig
+
+    objects = bpy.context.scene.objects
+    sig = len(objects)
+
+    if _camera_users is None or sig != _camera_users_sig:
+        index = {}
+        for obj in objects:
+            if obj.type == 'CAMERA':
+                index.setdefault(obj.data, []).append(obj)
+        _camera_users = index
+        _camera_users_sig = sig
+
+    return _camera_users.get(cam_data, ())
+
+
+# ------------------------------------------------------------------------------------------------------
+# Node socket resolution cache
+# ------------------------------------------------------------------------------------------------------
+
+# Resolved (tree, owner_name, node_name, input_index) per data_path for
+# the shader / node-group autokey paths. Only successful resolutions are
+# cached, so a mapping pointing at a node the user creates later starts
+# working as soon as it exists.
+_socket_cache = {}
+
+
+def invalidate_resolved_sockets():
+    """
+    Drop all cached node socket resolutions (called on file load from
+    core/osc_server._on_load_post, with the other runtime caches).
+    """
+    _socket_cache.clear()
+
+
+def _resolve_socket(data_path: str):
+    """
+    Resolve the node tree and socket a shader/node-group path targets.
+
+    Uncached, this costs a datablock lookup, a nodes.get and an inputs
+    index per message; the result is memoized per data_path (validated
+    against removed datablocks on each hit) so the steady state is one
+    dict lookup.
+
+    Returns:
+        (target_tree, owner_name, node_name, input_index), or None when
+        the path does not describe a resolvable node input socket.
+    """
+    cached = _socket_cache.get(data_path)
+    if cached is not None:
+        try:
+            # Cheap liveness probe on the cached tree reference
+            cached[0].name
+            return cached
+        except ReferenceError:
+            del _socket_cache[data_path]
+
+    node_match = _SHADER_NODE_RE.search(data_path)
+    if not node_match:
+        return None
+
+    target_tree = None
+    owner_name = None
+
+    if 'bpy.data.node_groups[' in data_path:
+        ng_match = _NG_NAME_RE.search(data_path)
+        if ng_match:
+            owner_name = ng_match.group(1)
+            target_tree = bpy.data.node_groups.get(owner_name)
+    else:
+        mat_match = _MAT_TEX_NAME_RE.search(data_path)
+        if mat_match:
+            owner_name = mat_match.group(1)
+            if 'materials' in data_path:
+                mat = bpy.data.materials.get(owner_name)
+                target_tree = mat.node_tree if mat else None
+            elif 'textures' in data_path:
+                tex = bpy.data.textures.get(owner_name)
+                target_tree = tex.node_tree if tex else None
+
+    if target_tree is None:
+        return None
+
+    node_name = node_match.group(1) or node_match.group(2)
+    input_index = int(node_match.group(3))
+
+    node = target_tree.nodes.get(node_name)
+    if node is None or input_index >= len(node.inputs):
+        return None
+
+    resolved = (target_tree, owner_name, node_name, input_index)
+    _socket_cache[data_path] = resolved
+    return resolved
+
+
+# ------------------------------------------------------------------------------------------------------
+# Timeline playback toggling
+# ------------------------------------------------------------------------------------------------------
+
+def _toggle_playback(should_play: bool):
+    """
+    Start or stop timeline playback, only when the state actually changes.
+
+    The state comparison runs before any operator lookup, so the common
+    case — an OSC toggle re-sending its current state — costs a single
+    RNA read. When a real toggle is needed, the operator is invoked
+    under temp_override with the current window/screen pinned, skipping
+    the window and area search the default bpy.ops call performs.
+    """
+    ctx = bpy.context
+    screen = ctx.screen
+
+    if should_play == screen.is_animation_playing:
+        return
+
+    with ctx.temp_override(window=ctx.window, screen=screen):
+        if should_play:
+            # Start playback
+            bpy.ops.screen.animation_play()
+            if _DEBUG:
+                print(f"▶️ Timeline PLAY")
+        else:
+            # Stop playback without restoring the initial frame
+            bpy.ops.screen.animation_cancel(restore_frame=False)
+            if _DEBUG:
+                print(f"⏸️ Timeline PAUSE")
+
+
+# ------------------------------------------------------------------------------------------------------
+# Session keyframing preferences
+# ------------------------------------------------------------------------------------------------------
+
+# User preference values stashed by _osc_begin_session, or None when no
+# session is active
+_saved_key_prefs = None
+
+
+def _osc_begin_session():
+    """
+    Switch the keyframing preferences to cheap defaults for the session.
+
+    Assigning the interpolation/handle type per key is a large share of
+    keyframe_insert's cost (Blender recomputes the fcurve each time).
+    Setting keyframe_new_interpolation_type to CONSTANT once means every
+    key inserted while the OSC server runs gets the cheap interpolation
+    with no per-key writeback. Called by osc_server.start_server; the
+    previous values are restored by _osc_end_session.
+    """
+    global _saved_key_prefs
+
+    if _saved_key_prefs is not None:
+        return
+
+    edit = bpy.context.preferences.edit
+    _saved_key_prefs = (
+        edit.keyframe_new_interpolation_type,
+        edit.keyframe_new_handle_type,
+    )
+    edit.keyframe_new_interpolation_type = 'CONSTANT'
+    edit.keyframe_new_handle_type = 'VECTOR'
+
+
+def _osc_end_session():
+    """
+    Restore the keyframing preferences stashed by _osc_begin_session.
+
+    Called by osc_server.stop_server so the user's own interpolation
+    settings come back as soon as the OSC session ends.
+    """
+    global _saved_key_prefs
+
+    if _saved_key_prefs is None:
+        return
+
+    edit = bpy.context.preferences.edit
+    (
+        edit.keyframe_new_interpolation_type,
+        edit.keyframe_new_handle_type,
+    ) = _saved_key_prefs
+    _saved_key_prefs = None
+
+
+# ------------------------------------------------------------------------------------------------------
+# Batched keyframe insertion
+# ------------------------------------------------------------------------------------------------------
+
+# Seconds between flushes of the pending keyframe buffer
+_KEY_FLUSH_INTERVAL = 0.1
+
+# Pending keyframes per fcurve, keyed by (owner.as_pointer(), data_path,
+# index): the C pointer identifies the datablock itself, unlike id() of
+# the short-lived RNA wrappers, so repeated applies on the same target
+# coalesce into one entry per fcurve.
+# Values are [owner, data_path, index, {frame: value}]; the inner dict
+# keeps only the newest value per frame, so a controller streaming
+# faster than the frame rate does not pile up duplicate keys.
+_pending_keys = {}
+
+# True while the flush timer is registered; it unregisters itself when
+# the buffer drains so an idle session costs nothing.
+_flush_registered = False
+
+# Last frame queued per fcurve, keyed like _pending_keys. While the
+# playhead stays on the same frame only the buffered value is refreshed;
+# the animation_data/Action checks run once per frame instead of once
+# per message. Entries retire with their fcurve group in _flush_keys,
+# so the memo stays bounded by what was queued between two flushes.
+_last_key_frame = {}
+
+
+def invalidate_keyframe_state():
+    """
+    Drop buffered keyframes and the per-fcurve frame memo.
+
+    Called when a new .blend file is loaded (load_post): the buffered
+    owner references belong to the previous file, and pointer-based keys
+    must not alias onto freshly allocated datablocks.
+    """
+    _pending_keys.clear()
+    _last_key_frame.clear()
+
+
+def _queue_key(owner, path: str, index: int, frame, value, action_name: str):
+    """
+    Buffer one keyframe for later bulk insertion instead of keying now.
+
+    obj.keyframe_insert runs the slow per-key fcurve update path; at
+    controller rates (100+ Hz) that dominates the autokey cost. Queued
+    keys are written in batches by _flush_keys via keyframe_points.add +
+    foreach_set, which updates the fcurve once per flush. Only the
+    newest value per frame is kept, and the RNA-side bookkeeping
+    (animation_data / Action creation) is skipped entirely while
+    frame_current has not advanced since the last queued key.
+
+    Args:
+        owner: The ID datablock that owns the action (object, node tree...).
+        path: Fcurve data path relative to that ID.
+        index: Array index of the fcurve (0 for scalar properties).
+        frame: Frame to key.
+        value: Value to key.
+        action_name: Name for the Action if one has to be created.
+    """
+    global _flush_registered
+
+    key = (owner.as_pointer(), path, index)
+    entry = _pending_keys.get(key)
+
+    if entry is None:
+        _pending_keys[key] = [owner, path, index, {float(frame): float(value)}]
+    else:
+        entry[3][float(frame)] = float(value)
+
+    # Same frame as the last queued key: the value above is all that can
+    # change, so the per-message autokey work stops here
+    if _last_key_frame.get(key) != frame:
+        _last_key_frame[key] = frame
+
+        # Ensure animation_data and an Action exist for the flush
+        if owner.animation_data is None:
+            owner.animation_data_create()
+
+        if owner.animation_data.action is None:
+            owner.animation_data.action = bpy.data.actions.new(name=action_name)
+
+    if not _flush_registered:
+        bpy.app.timers.register(_flush_keys, first_interval=_KEY_FLUSH_INTERVAL)
+        _flush_registered = True
+
+
+def _flush_keys():
+    """
+    Write all buffered keyframes in bulk, one fcurve update per curve.
+
+    Runs on Blender's main thread via bpy.app.timers. For each pending
+    group it finds or creates the fcurve, writes the points (bulk
+    add + foreach_set on fresh fcurves, keyframe_points.insert on curves
+    that already have keys so a point on the same frame is replaced, not
+    duplicated) and calls fcu.update() once. Returns None to unregister
+    itself when the buffer is empty.
+    """
+    global _flush_registered
+
+    if not _pending_keys:
+        # Nothing buffered: stop ticking until _queue_key re-registers
+        _flush_registered = False
+        return None
+
+    # Retire the frame memo along with the groups being flushed; the
+    # next apply on a target pays the animation_data check once again
+    # instead of the dict holding an entry per driven path forever.
+    for key in _pending_keys:
+        _last_key_frame.pop(key, None)
+
+    pending = list(_pending_keys.values())
+    _pending_keys.clear()
+
+    for owner, path, index, frames in pending:
+        try:
+            anim = owner.animation_data
+            action = anim.action if anim else None
+            if action is None:
+                continue
+
+            fcu = action.fcurves.find(path, index=index)
+            if fcu is None:
+                fcu = action.fcurves.new(path, index=index, action_group="OSC")
+
+            pts = fcu.keyframe_points
+            count = len(frames)
+
+            if len(pts) == 0:
+                # Fresh fcurve: one bulk write for all coordinates (the
+                # per-flush dict guarantees the frames are unique)
+                pts.add(count)
+                flat = [0.0] * (2 * count)
+                flat[0::2] = frames.keys()
+                flat[1::2] = frames.values()
+                pts.foreach_set("co", flat)
+            else:
+                # Existing keys: insert() replaces a point already
+                # sitting on the same frame, where add() would append a
+                # duplicate every flush while the playhead is paused.
+                # FAST defers handle recalculation to the update() below.
+                for frame, val in frames.items():
+                    pts.insert(frame, val, options={'FAST'})
+
+            fcu.update()
+
+        except (ReferenceError, RuntimeError):
+            # The owner datablock vanished between queue and flush
+            continue
+
+    return _KEY_FLUSH_INTERVAL
+
+
+# ------------------------------------------------------------------------------------------------------
+# Per-path write coalescing
+# ------------------------------------------------------------------------------------------------------
+
+# Seconds between flushes of the coalesced writes (~one display frame)
+_LATEST_FLUSH_INTERVAL = 0.016
+
+# Newest pending value per data_path; a fader streaming faster than the
+# frame rate collapses to a single real write per flush.
+_latest = {}
+
+# True while the coalescing flush timer is registered
+_latest_flush_registered = False
+
 
 def apply_generic_value(data_path: str, value: float) -> bool:
+    """
+    Record the newest value for data_path and schedule it for applying.
+
+    Blender only renders once per display frame, so applying every
+    intermediate value of a fast OSC source is wasted work: only the
+    newest value per data_path is kept, and a ~16ms timer flushes the
+    pending writes through _apply_now. Autokey (inside _apply_now) keys
+    at the frame current at flush time, which is all the resolution a
+    rendered frame can show.
+    """
+    global _latest_flush_registered
+
+    _latest[data_path] = value
+
+    if not _latest_flush_registered:
+        bpy.app.timers.register(_flush_latest, first_interval=_LATEST_FLUSH_INTERVAL)
+        _latest_flush_registered = True
+
+    return True
+
+
+def _flush_latest():
+    """
+    Apply the newest coalesced value of every pending data_path.
+
+    Runs on Blender's main thread via bpy.app.timers and unregisters
+    itself (returns None) once the pending dict is empty.
+    """
+    global _latest_flush_registered
+
+    if not _latest:
+        _latest_flush_registered = False
+        return None
+
+    pending = _latest.copy()
+    _latest.clear()
+
+    for data_path, value in pending.items():
+        try:
+            _apply_now(data_path, value)
+        except Exception as e:
+            # A raising timer callback gets unregistered by Blender, so
+            # one bad path (e.g. no scene during a file-load window)
+            # must not take down all generic OSC updates; mirrors the
+            # batch guard in osc_timer_step_extended.
+            print(f"⚠️ OSC application error ({data_path}): {e}")
+
+    return _LATEST_FLUSH_INTERVAL
+
+
+def _apply_now(data_path: str, value: float) -> bool:
     """
     Apply a numeric value to a generic Blender property described by data_path.
 
@@ -41,539 +752,470 @@ def apply_generic_value(data_path: str, value: float) -> bool:
     - Optionally insert keyframes if osc_autokey is enabled on the Scene
     - Return True on success, False on failure or unsupported data_path
     """
-    try:
+    if _DEBUG:
         print(f"Attempting to apply {value} to {data_path}")
-        
-        # For safety, only allow paths that explicitly start with 'bpy.'
-        if not data_path.startswith('bpy.'):
-            return False
-        
-        # ----------------------------------------------------------------------------------------------
-        # Special case: timeline frame control (frame_current)
-        # ----------------------------------------------------------------------------------------------
-        if 'frame_current' in data_path:
-            try:
-                frame_value = int(round(value))
 
-                # Avoid fighting with live playback: only set frame when stopped
-                if not bpy.context.screen.is_animation_playing:
-                    bpy.context.scene.frame_set(frame_value)
+    # Cached branch decision (also rejects paths not starting 'bpy.')
+    branch = _classify(data_path)
 
-                return True
+    if branch == _B_INVALID:
+        return False
 
-            except Exception as e:
-                print(f"❌ Timeline error: {e}")
-                return False
+    # Hoisted once per call: every autokey block below used to
+    # re-read these RNA properties
+    scene = bpy.context.scene
+    autokey = scene.osc_autokey
+    current_frame = scene.frame_current
+    
+    # ----------------------------------------------------------------------------------------------
+    # Special case: timeline frame control (frame_current)
+    # ----------------------------------------------------------------------------------------------
+    if branch == _B_TIMELINE:
+        try:
+            frame_value = int(round(value))
 
-        # ----------------------------------------------------------------------------------------------
-        # Special case: Play/Pause the timeline
-        # ----------------------------------------------------------------------------------------------
-        if (
-            'is_animation_playing' in data_path 
-            or data_path == 'bpy.context.screen.is_animation_playing'
-        ):
-            try:
-                # Any value > 0.5 is treated as "play", otherwise "pause"
-                should_play = bool(value > 0.5)
-                is_playing = bpy.context.screen.is_animation_playing
-                
-                if should_play and not is_playing:
-                    # Start playback
-                    bpy.ops.screen.animation_play()
-                    print(f"▶️ Timeline PLAY")
-
-                elif not should_play and is_playing:
-                    # Stop playback without restoring the initial frame
-                    bpy.ops.screen.animation_cancel(restore_frame=False)
-                    print(f"⏸️ Timeline PAUSE")
-                
-                return True
+            # Avoid fighting with live playback: only set frame when stopped
+            if not bpy.context.screen.is_animation_playing:
+                bpy.context.scene.frame_set(frame_value)
 
-            except Exception as e:
-                print(f"❌ Error play/pause: {e}")
-                return False
+            return True
 
-        # ----------------------------------------------------------------------------------------------
-        # Special case: shader nodes (materials / textures)
-        #
-        # Example: bpy.data.materials['Mat'].node_tree.nodes["MyNode"].inputs[0].default_value
-        # ----------------------------------------------------------------------------------------------
-        if (
-            '.node_tree.nodes[' in data_path 
-            and (
-                'bpy.data.materials[' in data_path 
-                or 'bpy.data.textures[' in data_path
-            )
-        ):
-            try:
-                # Direct assignment using the data_path expression
-                exec(f"{data_path} = {value}")
-                
-                # Auto-keying for shader nodes if enabled
-                if bpy.context.scene.osc_autokey:
-                    try:
-                        current_frame = bpy.context.scene.frame_current
-                        
-                        # Extract material or texture name
-                        mat_match = re.search(
-                            r"(?:materials|textures)\['([^']+)'\]", data_path
+        except Exception as e:
+            print(f"❌ Timeline error: {e}")
+            return False
+
+    # ----------------------------------------------------------------------------------------------
+    # Special case: Play/Pause the timeline
+    # ----------------------------------------------------------------------------------------------
+    if branch == _B_PLAYBACK:
+        try:
+            # Any value > 0.5 is treated as "play", otherwise "pause"
+            _toggle_playback(value > 0.5)
+            return True
+
+        except Exception as e:
+            print(f"❌ Error play/pause: {e}")
+            return False
+
+    # ----------------------------------------------------------------------------------------------
+    # Special case: shader nodes (materials / textures)
+    #
+    # Example: bpy.data.materials['Mat'].node_tree.nodes["MyNode"].inputs[0].default_value
+    # ----------------------------------------------------------------------------------------------
+    if branch == _B_SHADER_NODE:
+        try:
+            # Direct assignment via the parsed path; exec only remains
+            # as a fallback for paths the tokenizer cannot handle
+            if not _resolve_and_assign(data_path, value):
+                exec(_compile_assign(data_path), {"bpy": bpy, "__v__": value})
+            
+            # Auto-keying for shader nodes if enabled
+            if autokey:
+                try:
+                    # Cached tree/node/socket resolution for this path
+                    resolved = _resolve_socket(data_path)
+                    if resolved is not None:
+                        target_tree, obj_name, node_name, input_index = resolved
+
+                        # Queue the keyframe for bulk insertion
+                        _queue_key(
+                            target_tree,
+                            f'nodes["{node_name}"].inputs[{input_index}].default_value',
+                            0,
+                            current_frame,
+                            value,
+                            f"{obj_name}_ShaderAction",
                         )
-                        if mat_match:
-                            obj_name = mat_match.group(1)
-                            target_tree = None
-                            
-                            if 'materials' in data_path:
-                                mat = bpy.data.materials.get(obj_name)
-                                target_tree = mat.node_tree if mat else None
-
-                            elif 'textures' in data_path:
-                                tex = bpy.data.textures.get(obj_name)
-                                target_tree = tex.node_tree if tex else None
-                            
-                            if target_tree: 
-                                # Extract the node and input index
-                                node_match = re.search(
-                                    r'nodes\[(?:\"([^\"]+)\"|\'([^\']+)\')\]\.inputs\[(\d+)\]\.default_value', 
-                                    data_path
-                                )
-                                if node_match:
-                                    node_name = node_match.group(1) or node_match.group(2) 
-                                    input_index = int(node_match.group(3))
-                                    
-                                    node = target_tree.nodes.get(node_name)
-                                    if node and input_index < len(node.inputs):
-                                        socket = node.inputs[input_index]
-                                        
-                                        # Ensure animation_data and an Action exist
-                                        if target_tree.animation_data is None:  
-                                            target_tree.animation_data_create()
-
-                                        if target_tree.animation_data.action is None:  
-                                            action_name = f"{obj_name}_ShaderAction"
-                                            target_tree.animation_data.action = bpy.data.actions.new(name=action_name)
-                                        
-                                        # Insert keyframe on the socket
-                                        socket.keyframe_insert(
-                                            data_path="default_value", 
-                                            frame=current_frame, 
-                                            group="OSC"
-                                        )
-                                        print(
-                                            f"🔴 Keyframe inserted: "
-                                            f"{node_name}.inputs[{input_index}] at frame {current_frame}"
-                                        )
-                    
-                    except Exception as ke:
-                        print(f"⚠️ Autokey shader node failed: {ke}")
+                        if _DEBUG:
+                            print(
+                                f"🔴 Keyframe queued: "
+                                f"{node_name}.inputs[{input_index}] at frame {current_frame}"
+                            )
                 
+                except Exception as ke:
+                    print(f"⚠️ Autokey shader node failed: {ke}")
+            
+            if _DEBUG:
                 print(f"✅ Shader node update: {data_path} = {value}")
-                return True
+            return True
+        
+        except Exception as e:
+            print(f"❌ Shader node error: {e}")
+            return False
+
+    # ----------------------------------------------------------------------------------------------
+    # Special case: standalone node_groups (bpy.data.node_groups)
+    #
+    # Example: bpy.data.node_groups['Group'].nodes["Node"].inputs[0].default_value
+    # ----------------------------------------------------------------------------------------------
+    if branch == _B_NODE_GROUP:
+        try:
+            # Direct assignment on the node group input (exec fallback
+            # only for paths the tokenizer cannot handle)
+            if not _resolve_and_assign(data_path, value):
+                exec(_compile_assign(data_path), {"bpy": bpy, "__v__": value})
             
-            except Exception as e:
-                print(f"❌ Shader node error: {e}")
-                return False
+            # Auto-keying for node group sockets
+            if autokey:
+                try:
+                    # Cached tree/node/socket resolution for this path
+                    resolved = _resolve_socket(data_path)
+                    if resolved is not None:
+                        node_group, ng_name, node_name, input_index = resolved
 
-        # ----------------------------------------------------------------------------------------------
-        # Special case: standalone node_groups (bpy.data.node_groups)
-        #
-        # Example: bpy.data.node_groups['Group'].nodes["Node"].inputs[0].default_value
-        # ----------------------------------------------------------------------------------------------
-        if (
-            'bpy.data.node_groups[' in data_path 
-            and '.nodes[' in data_path 
-            and '.inputs[' in data_path
-        ):
-            try:
-                # Direct assignment on the node group input
-                exec(f"{data_path} = {value}")
-                
-                # Auto-keying for node group sockets
-                if bpy.context.scene.osc_autokey:
-                    try:
-                        current_frame = bpy.context.scene.frame_current
-                        
-                        # Extract the node_group name
-                        ng_match = re.search(
-                            r"node_groups\['([^']+)'\]", data_path
+                        # Queue the keyframe for bulk insertion
+                        _queue_key(
+                            node_group,
+                            f'nodes["{node_name}"].inputs[{input_index}].default_value',
+                            0,
+                            current_frame,
+                            value,
+                            f"{ng_name}_NodesAction",
                         )
-                        if ng_match:
-                            ng_name = ng_match.group(1)
-                            node_group = bpy.data.node_groups.get(ng_name)
-                            
-                            if node_group:
-                                # Extract node name and input index
-                                node_match = re.search(
-                                    r'nodes\[(?:\"([^\"]+)\"|\'([^\']+)\')\]\.inputs\[(\d+)\]\.default_value', 
-                                    data_path
-                                )
-                                if node_match:
-                                    node_name = node_match.group(1) or node_match.group(2)
-                                    input_index = int(node_match.group(3))
-                                    
-                                    node = node_group.nodes.get(node_name)
-                                    if node and input_index < len(node.inputs):
-                                        socket = node.inputs[input_index]
-                                        
-                                        # Ensure animation_data and an Action exist
-                                        if node_group.animation_data is None:
-                                            node_group.animation_data_create()
-
-                                        if node_group.animation_data.action is None:
-                                            action_name = f"{ng_name}_NodesAction"
-                                            node_group.animation_data.action = bpy.data.actions.new(name=action_name)
-                                        
-                                        # Insert keyframe on the socket
-                                        socket.keyframe_insert(
-                                            data_path="default_value", 
-                                            frame=current_frame, 
-                                            group="OSC"
-                                        )
-                                        print(
-                                            f"🔴 Keyframe inserted: "
-                                            f"{ng_name}.{node_name}.inputs[{input_index}] "
-                                            f"at frame {current_frame}")
-                    
-                    except Exception as ke:
-                        print(f"⚠️ Autokey node_group failed: {ke}")
+                        if _DEBUG:
+                            print(
+                                f"🔴 Keyframe queued: "
+                                f"{ng_name}.{node_name}.inputs[{input_index}] "
+                                f"at frame {current_frame}")
                 
-                print(f"✅ Node group node update: {data_path} = {value}")
-                return True
+                except Exception as ke:
+                    print(f"⚠️ Autokey node_group failed: {ke}")
             
-            except Exception as e:
-                print(f"❌ Error node_group node: {e}")
-                return False
+            if _DEBUG:
+                print(f"✅ Node group node update: {data_path} = {value}")
+            return True
+        
+        except Exception as e:
+            print(f"❌ Error node_group node: {e}")
+            return False
 
-        # ----------------------------------------------------------------------------------------------
-        # Special case: generic bpy.data.* properties
-        #
-        # Handles objects, cameras, lights, etc. and supports autokeying
-        #
-        #   bpy.data.objects['Cube'].location[0]
-        #   bpy.data.objects['Camera'].data.lens
-        #   bpy.data.cameras['Camera'].lens
-        # ----------------------------------------------------------------------------------------------
-        if 'bpy.data.' in data_path:
-            try:
-                # Direct assignment on any bpy.data.* path
-                exec(f"{data_path} = {value}")
-                
-                if bpy.context.scene.osc_autokey:
-                    try:
-                        # Extract the object/datablock name between ['...']
-                        if '[' in data_path:
-                            obj_name = data_path.split("['")[1].split("']")[0]
-                            
-                            target_obj = None
-                            relative_path = None
-                            
-                            # Case: bpy.data.objects['Name'].something
-                            if 'objects' in data_path:
-                                target_obj = bpy.data.objects.get(obj_name)
-                                
-                                # Path after "objects['Name']."
-                                full_remaining = data_path.split(f"objects['{obj_name}'].")[1]
-                                
-                                # Special handling for ".data.<prop>"
-                                if full_remaining.startswith('data.'):
-                                    # For cameras and lights, keyframe the datablock
-                                    if target_obj and target_obj.type == 'CAMERA':
-                                        target_obj = target_obj.data
-                                        relative_path = full_remaining.replace('data.', '')
-
-                                    elif target_obj and target_obj.type == 'LIGHT':
-                                        target_obj = target_obj.data
-                                        relative_path = full_remaining.replace('data.', '')
-
-                                    else:
-                                         # Other objects: keep .data in the path
-                                        relative_path = full_remaining
-                                else:
-                                    # Normal case without ".data"
-                                    relative_path = full_remaining
-
-                            # Case: bpy.data.cameras['Name'].something
-                            elif 'cameras' in data_path:
-                                cam_data = bpy.data.cameras.get(obj_name)
-                                if cam_data:
-                                    target_obj = cam_data
-                                    relative_path = data_path.split(f"cameras['{obj_name}'].")[1]
-                            
-                            # Insert keyframe on the resolved target_obj and path
-                            if target_obj and relative_path:
-                                current_frame = bpy.context.scene.frame_current
-                                
-                                # Ensure animation_data and an Action exist
-                                if target_obj.animation_data is None:
-                                    target_obj.animation_data_create()
-
-                                if target_obj.animation_data.action is None:
-                                    # Use a more descriptive Action name depending on type
-                                    if isinstance(target_obj, bpy.types.Camera):
-                                        action_name = f"{target_obj.name}_CameraAction"
-                                    elif isinstance(target_obj, bpy.types.Light):
-                                        action_name = f"{target_obj.name}_LightAction"
-                                    else:
-                                        action_name = f"{target_obj.name}_OSCAction"
-                                    target_obj.animation_data.action = bpy.data.actions.new(name=action_name)
-
-                                # Detect array-like paths (e.g. location[0])
-                                index_match = re.match(
-                                    r'(.+)\[(\d+)\]$', 
-                                    relative_path
-                                )
+    # ----------------------------------------------------------------------------------------------
+    # Special case: generic bpy.data.* properties
+    #
+    # Handles objects, cameras, lights, etc. and supports autokeying
+    #
+    #   bpy.data.objects['Cube'].location[0]
+    #   bpy.data.objects['Camera'].data.lens
+    #   bpy.data.cameras['Camera'].lens
+    # ----------------------------------------------------------------------------------------------
+    if branch == _B_BPY_DATA:
+        try:
+            # Direct assignment on any bpy.data.* path (exec fallback
+            # only for paths the tokenizer cannot handle)
+            if not _resolve_and_assign(data_path, value):
+                exec(_compile_assign(data_path), {"bpy": bpy, "__v__": value})
 
-                                if index_match:
-                                    # Path with index: location[0], rotation_euler[2], etc.
-                                    base_path = index_match.group(1)
-                                    index = int(index_match.group(2))
-
-                                    target_obj.keyframe_insert(
-                                        data_path=base_path, 
-                                        index=index, 
-                                        frame=current_frame, 
-                                        group="OSC"
-                                    )
-                                    print(
-                                        f"🔴 Keyframe insert: {base_path}[{index}] "
-                                        f"at frame {current_frame}"
-                                    )
-                                else:
-                                     # Simple property path without index: lens, hide_viewport, etc.
-                                    target_obj.keyframe_insert(
-                                        data_path=relative_path, 
-                                        frame=current_frame, 
-                                        group="OSC"
-                                    )
-                                    print(
-                                        f"🔴 Keyframe insert: {relative_path} "
-                                        f"at frame {current_frame}"
-                                    )
-                                
-                    except Exception as ke:
-                        print(f"⚠️ Autokey bpy.data failed: {ke}")
-                
-                # Tag objects/datablocks as updated so the depsgraph knows to refresh
-                if '[' in data_path:
-                    obj_name = data_path.split("['")[1].split("']")[0]
-
-                    # If we modified bpy.data.objects['Name'], update that object
-                    if 'objects' in data_path:
-                        obj = bpy.data.objects.get(obj_name)
-                        if obj:
-                            obj.update_tag()
+            # One scan extracts collection and datablock name; the
+            # dotted remainder follows the match end. Replaces the
+            # split-based extraction (three passes, several new
+            # strings per message).
+            generic_match = _GENERIC_RE.match(data_path)
 
-                    # If we modified bpy.data.cameras['Name'], update any scene object
-                    # that uses this camera datablock        
-                    elif 'cameras' in data_path:
+            if autokey and generic_match:
+                try:
+                    coll_name = generic_match.group(1)
+                    obj_name = generic_match.group(2)
+                    remainder = data_path[generic_match.end():]
+
+                    target_obj = None
+                    relative_path = None
+
+                    # Case: bpy.data.objects['Name'].something
+                    if coll_name == 'objects' and remainder.startswith('.'):
+                        target_obj = bpy.data.objects.get(obj_name)
+
+                        # Path after "objects['Name']."
+                        full_remaining = remainder[1:]
+
+                        # Special handling for ".data.<prop>"
+                        if full_remaining.startswith('data.'):
+                            # For cameras and lights, keyframe the datablock
+                            if target_obj and target_obj.type == 'CAMERA':
+                                target_obj = target_obj.data
+                                relative_path = full_remaining.replace('data.', '')
+
+                            elif target_obj and target_obj.type == 'LIGHT':
+                                target_obj = target_obj.data
+                                relative_path = full_remaining.replace('data.', '')
+
+                            else:
+                                 # Other objects: keep .data in the path
+                                relative_path = full_remaining
+                        else:
+                            # Normal case without ".data"
+                            relative_path = full_remaining
+
+                    # Case: bpy.data.cameras['Name'].something
+                    elif coll_name == 'cameras' and remainder.startswith('.'):
                         cam_data = bpy.data.cameras.get(obj_name)
-                        for obj in bpy.context.scene.objects:
-                            if obj.type == 'CAMERA' and obj.data == cam_data:
-                                obj.update_tag()
-                
+                        if cam_data:
+                            target_obj = cam_data
+                            relative_path = remainder[1:]
+
+                    # Insert keyframe on the resolved target_obj and path
+                    if target_obj and relative_path:
+                        # Use a more descriptive Action name depending on type
+                        suffix = _ACTION_SUFFIX.get(
+                            type(target_obj).__name__, "_OSCAction"
+                        )
+                        action_name = f"{target_obj.name}{suffix}"
+
+                        # Detect array-like paths (e.g. location[0])
+                        index_match = _INDEX_RE.match(relative_path)
+
+                        if index_match:
+                            # Path with index: location[0], rotation_euler[2], etc.
+                            base_path = index_match.group(1)
+                            index = int(index_match.group(2))
+
+                            _queue_key(
+                                target_obj, base_path, index,
+                                current_frame, value, action_name,
+                            )
+                            if _DEBUG:
+                                print(
+                                    f"🔴 Keyframe queued: {base_path}[{index}] "
+                                    f"at frame {current_frame}"
+                                )
+                        else:
+                             # Simple property path without index: lens, hide_viewport, etc.
+                            _queue_key(
+                                target_obj, relative_path, 0,
+                                current_frame, value, action_name,
+                            )
+                            if _DEBUG:
+                                print(
+                                    f"🔴 Keyframe queued: {relative_path} "
+                                    f"at frame {current_frame}"
+                                )
+                        
+                except Exception as ke:
+                    print(f"⚠️ Autokey bpy.data failed: {ke}")
+            
+            # Tag objects/datablocks as updated so the depsgraph knows to refresh
+            if generic_match:
+                coll_name = generic_match.group(1)
+                obj_name = generic_match.group(2)
+
+                # If we modified bpy.data.objects['Name'], update that object
+                if coll_name == 'objects':
+                    obj = bpy.data.objects.get(obj_name)
+                    if obj:
+                        obj.update_tag()
+
+                # If we modified bpy.data.cameras['Name'], update any scene object
+                # that uses this camera datablock (via the reverse index)
+                elif coll_name == 'cameras':
+                    cam_data = bpy.data.cameras.get(obj_name)
+                    if cam_data:
+                        for obj in _camera_users_for(cam_data):
+                            obj.update_tag()
+            
+            if _DEBUG:
                 print(f"✅ bpy.data updated: {data_path} = {value}")
-                return True
+            return True
+        
+        except Exception as e:
+            print(f"❌ Error bpy.data: {e}")
+            return False    
+
+    # Special case for Geometry Nodes modifiers
+    if branch == _B_MODIFIER:
+        try:
+            parts = data_path.split('].modifiers[')
+            obj_part = parts[0] + ']'
+            modifier_part = parts[1]
             
-            except Exception as e:
-                print(f"❌ Error bpy.data: {e}")
-                return False    
-
-        # Special case for Geometry Nodes modifiers
-        if '.modifiers[' in data_path and '][' in data_path:
-            try:
-                parts = data_path.split('].modifiers[')
-                obj_part = parts[0] + ']'
-                modifier_part = parts[1]
-                
-                modifier_name = modifier_part.split("']['")[0].strip("'\"")
-                socket_name = modifier_part.split("']['")[1].rstrip("']").strip("'\"")
-                
+            modifier_name = modifier_part.split("']['")[0].strip("'\"")
+            socket_name = modifier_part.split("']['")[1].rstrip("']").strip("'\"")
+            
+            obj = _resolve_path(obj_part)
+            if obj is None:
+                # Fallback for paths the tokenizer cannot handle
                 obj = eval(obj_part)
-                modifier = obj.modifiers.get(modifier_name)
-                
-                if modifier:
-                    try:
-                        current_value = modifier[socket_name]
-                        
-                        # Proper type conversion
-                        if isinstance(current_value, bool):
-                            new_value = bool(value > 0.5)
-                        elif isinstance(current_value, int):
-                            new_value = int(round(value))
-                        else:
-                            new_value = float(value)
-                        
-                        # Apply value
-                        modifier[socket_name] = new_value
-                        
-                        # Auto-keying for modifiers
-                        if bpy.context.scene.osc_autokey:
-                            current_frame = bpy.context.scene.frame_current
-                            
-                            # Ensure that the animation_data exists
-                            if obj.animation_data is None:
-                                obj.animation_data_create()
-                            if obj.animation_data.action is None:
-                                action_name = f"{obj.name}_OSCAction"
-                                obj.animation_data.action = bpy.data.actions.new(name=action_name)
-                            
-                            # Insert keyframe on the modifier
-                            modifier.keyframe_insert(data_path=f'["{socket_name}"]', frame=current_frame, group="OSC")
-                            print(f"✅ Keyframe added on the modifier {modifier_name}[{socket_name}] at frame {current_frame}")
-                        
-                        return True
-                        
-                    except KeyError:
-                        print(f"Socket '{socket_name}' not found in the modifier")
-                        return False
-                else:
-                    print(f"Modifier '{modifier_name}' not found")
-                    return False
+            modifier = obj.modifiers.get(modifier_name)
+            
+            if modifier:
+                try:
+                    current_value = modifier[socket_name]
                     
-            except Exception as e:
-                print(f"Geometry Nodes Modifier Error: {e}")
-                return False
-        
-        # Special case for Geometry Nodes in the editor
-        elif '.node_groups[' in data_path and '.nodes[' in data_path:
-            try:
-                print(f"🔧 Geometry Node detected in editor: {data_path}")
-                
-                parts = data_path.split('.')
-                prop_name = parts[-1]
-                parent_path = '.'.join(parts[:-1])
-                parent_obj = eval(parent_path)
-                
-                # Change value
-                if hasattr(parent_obj, prop_name):
-                    current_value = getattr(parent_obj, prop_name)
+                    # Proper type conversion
                     if isinstance(current_value, bool):
-                        setattr(parent_obj, prop_name, value > 0.5)
+                        new_value = bool(value > 0.5)
+                    elif isinstance(current_value, int):
+                        new_value = int(round(value))
                     else:
-                        setattr(parent_obj, prop_name, value)
+                        new_value = float(value)
                     
-                    # Auto-keying for nodes
-                    if bpy.context.scene.osc_autokey:
-                        current_frame = bpy.context.scene.frame_current
-                        
-                        # Extract the node_group from the data_path
-                        node_group_match = re.search(r"node_groups\['([^']+)'\]", data_path)
-                        if node_group_match:
-                            node_group_name = node_group_match.group(1)
-                            node_group = bpy.data.node_groups.get(node_group_name)
-                            
-                            if node_group:
-                                if node_group.animation_data is None:
-                                    node_group.animation_data_create()
-                                if node_group.animation_data.action is None:
-                                    action_name = f"{node_group_name}_NodesAction"
-                                    node_group.animation_data.action = bpy.data.actions.new(name=action_name)
-                                
-                                # Construct the relative data_path
-                                relative_path = data_path.split(f"node_groups['{node_group_name}'].")[1]
-                                
-                                # Insert keyframe
-                                node_group.keyframe_insert(data_path=relative_path, frame=current_frame, group="OSC")
-                                print(f"✅ Keyframe added on the node_group '{node_group_name}' at frame {current_frame}")
+                    # Apply value
+                    modifier[socket_name] = new_value
+                    
+                    # Auto-keying for modifiers
+                    if autokey:
+                        # Queue the keyframe for bulk insertion
+                        _queue_key(
+                            obj,
+                            f'modifiers["{modifier_name}"]["{socket_name}"]',
+                            0,
+                            current_frame,
+                            new_value,
+                            f"{obj.name}_OSCAction",
+                        )
+                        if _DEBUG:
+                            print(f"✅ Keyframe queued on the modifier {modifier_name}[{socket_name}] at frame {current_frame}")
                     
                     return True
-                else:
-                    print(f"❌ Property {prop_name} not found")
-                    return False
                     
-            except Exception as e:
-                print(f"Geometry node error: {e}")
+                except KeyError:
+                    print(f"Socket '{socket_name}' not found in the modifier")
+                    return False
+            else:
+                print(f"Modifier '{modifier_name}' not found")
                 return False
-        
-        # Standard method for classical properties
-        else:
+                
+        except Exception as e:
+            print(f"Geometry Nodes Modifier Error: {e}")
+            return False
+    
+    # Special case for Geometry Nodes in the editor
+    elif branch == _B_GN_EDITOR:
+        try:
+            if _DEBUG:
+                print(f"🔧 Geometry Node detected in editor: {data_path}")
+            
             parts = data_path.split('.')
             prop_name = parts[-1]
-            obj_path = '.'.join(parts[:-1])
+            parent_path = '.'.join(parts[:-1])
+            parent_obj = _resolve_path(parent_path)
+            if parent_obj is None:
+                # Fallback for paths the tokenizer cannot handle
+                parent_obj = eval(parent_path)
             
-            try:
-                obj = eval(obj_path)
-            except Exception as e:
-                print(f"Impossible to assess the path {obj_path}: {e}")
+            # Change value
+            if hasattr(parent_obj, prop_name):
+                current_value = getattr(parent_obj, prop_name)
+                if isinstance(current_value, bool):
+                    setattr(parent_obj, prop_name, value > 0.5)
+                else:
+                    setattr(parent_obj, prop_name, value)
+                
+                # Auto-keying for nodes
+                if autokey:
+                    # Extract the node_group from the data_path
+                    node_group_match = _NG_NAME_RE.search(data_path)
+                    if node_group_match:
+                        node_group_name = node_group_match.group(1)
+                        node_group = bpy.data.node_groups.get(node_group_name)
+                        
+                        if node_group:
+                            # Construct the relative data_path
+                            relative_path = data_path.split(f"node_groups['{node_group_name}'].")[1]
+
+                            # Queue the keyframe for bulk insertion
+                            _queue_key(
+                                node_group, relative_path, 0, current_frame, value,
+                                f"{node_group_name}_NodesAction",
+                            )
+                            if _DEBUG:
+                                print(f"✅ Keyframe queued on the node_group '{node_group_name}' at frame {current_frame}")
+                
+                return True
+            else:
+                print(f"❌ Property {prop_name} not found")
                 return False
+                
+        except Exception as e:
+            print(f"Geometry node error: {e}")
+            return False
+    
+    # Standard method for classical properties
+    else:
+        parts = data_path.split('.')
+        prop_name = parts[-1]
+        obj_path = '.'.join(parts[:-1])
+        
+        try:
+            obj = _resolve_path(obj_path)
+            if obj is None:
+                # Fallback for paths the tokenizer cannot handle
+                obj = eval(obj_path)
+        except Exception as e:
+            print(f"Impossible to assess the path {obj_path}: {e}")
+            return False
+        
+        try:
+            # Custom properties detection
+            if prop_name.startswith('["') and prop_name.endswith('"]'):
+                custom_prop_name = prop_name[2:-2]
+                obj[custom_prop_name] = value
+                
+                if autokey:
+                    _queue_key(
+                        obj, prop_name, 0, current_frame, value,
+                        f"{obj.name}_OSCAction",
+                    )
+                    if _DEBUG:
+                        print(f"✅ Custom property '{custom_prop_name}' keyframe queued at frame {current_frame}")
+                
+                return True
             
-            try:
-                # Custom properties detection
-                if prop_name.startswith('["') and prop_name.endswith('"]'):
-                    custom_prop_name = prop_name[2:-2]
-                    obj[custom_prop_name] = value
+            # Handling arrays with indexes (e.g. location[0])
+            array_match = _ARRAY_PROP_RE.match(prop_name)
+            if array_match:
+                base_prop = array_match.group(1)
+                index = int(array_match.group(2))
+                
+                # Modify only the specific index
+                current_array = getattr(obj, base_prop)
+                if hasattr(current_array, '__len__') and index < len(current_array):
+                    current_array[index] = value
                     
-                    if bpy.context.scene.osc_autokey:
-                        current_frame = bpy.context.scene.frame_current
-                        
-                        if obj.animation_data is None:
-                            obj.animation_data_create()
-                        if obj.animation_data.action is None:
-                            action_name = f"{obj.name}_OSCAction"
-                            obj.animation_data.action = bpy.data.actions.new(name=action_name)
-                        
-                        obj.keyframe_insert(data_path=prop_name, frame=current_frame, group="OSC")
-                        print(f"✅ Custom property '{custom_prop_name}' keyframed at frame {current_frame}")
+                    if autokey:
+                        # Keyframe with specific index, queued for bulk insertion
+                        _queue_key(
+                            obj, base_prop, index, current_frame, value,
+                            f"{obj.name}_OSCAction",
+                        )
+                        if _DEBUG:
+                            print(f"✅ {base_prop}[{index}] keyframe queued at frame {current_frame}")
                     
                     return True
-                
-                # Handling arrays with indexes (e.g. location[0])
-                array_match = re.match(r'(\w+)\[(\d+)\]', prop_name)
-                if array_match:
-                    base_prop = array_match.group(1)
-                    index = int(array_match.group(2))
-                    
-                    # Modify only the specific index
-                    current_array = getattr(obj, base_prop)
-                    if hasattr(current_array, '__len__') and index < len(current_array):
-                        current_array[index] = value
-                        
-                        if bpy.context.scene.osc_autokey:
-                            current_frame = bpy.context.scene.frame_current
-                            
-                            if obj.animation_data is None:
-                                obj.animation_data_create()
-                            if obj.animation_data.action is None:
-                                action_name = f"{obj.name}_OSCAction"
-                                obj.animation_data.action = bpy.data.actions.new(name=action_name)
-                            
-                            # Keyframe with specific index
-                            obj.keyframe_insert(data_path=base_prop, index=index, frame=current_frame, group="OSC")
-                            print(f"✅ {base_prop}[{index}] keyframed at frame {current_frame}")
-                        
-                        return True
-                
-                # Simple properties
-                else:
+            
+            # Simple properties
+            else:
+                kind, length = _prop_kind(obj, prop_name)
+
+                if kind == 'BOOLEAN' and length == 0:
+                    setattr(obj, prop_name, value > 0.5)
+                elif length:
+                    # Array without index - we put the same value everywhere;
+                    # a tuple is the cheapest sequence RNA accepts here
+                    setattr(obj, prop_name, (value,) * length)
+                elif kind is None:
+                    # Custom/non-RNA property: keep the duck-typed path
                     current_value = getattr(obj, prop_name)
-                    
+
                     if isinstance(current_value, bool):
                         setattr(obj, prop_name, value > 0.5)
                     elif hasattr(current_value, '__len__') and not isinstance(current_value, str):
-                        # Array without index - we put the same value everywhere
-                        new_value = [value] * len(current_value)
-                        setattr(obj, prop_name, new_value)
+                        setattr(obj, prop_name, (value,) * len(current_value))
                     else:
                         setattr(obj, prop_name, value)
-                    
-                    if bpy.context.scene.osc_autokey:
-                        current_frame = bpy.context.scene.frame_current
-                        
-                        if obj.animation_data is None:
-                            obj.animation_data_create()
-                        if obj.animation_data.action is None:
-                            action_name = f"{obj.name}_OSCAction"
-                            obj.animation_data.action = bpy.data.actions.new(name=action_name)
-                        
-                        # Keyframe across the entire property
-                        obj.keyframe_insert(data_path=prop_name, frame=current_frame, group="OSC")
-                        print(f"✅ {prop_name} keyframed at frame {current_frame}")
-                
-                return True
+                else:
+                    setattr(obj, prop_name, value)
                 
-            except Exception as e:
-                print(f"Error assigning property {prop_name}: {e}")
-                return False
+                if autokey:
+                    # Keyframe queued for bulk insertion
+                    _queue_key(
+                        obj, prop_name, 0, current_frame, value,
+                        f"{obj.name}_OSCAction",
+                    )
+                    if _DEBUG:
+                        print(f"✅ {prop_name} keyframe queued at frame {current_frame}")
             
-    except Exception as e:
-        print(f"General error when applying the value to {data_path}: {e}")
-        return False
+            return True
+            
+        except Exception as e:
+            print(f"Error assigning property {prop_name}: {e}")
+            return False
+        
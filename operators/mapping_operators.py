@@ -20,7 +20,81 @@ Operators used to manage OSC mappings from the UI:
 """
 
 import bpy
-import re
+import operator
+
+from ..core.osc_server import invalidate_mapping_cache
+from ..properties.scene_props import GenericOSCMappingItem, OSCMappingItem
+
+
+# Annotated property names of the two mapping PropertyGroups, resolved
+# once at import time; the duplicate operators iterate these instead of
+# rebuilding an __annotations__ view per invocation. The matching
+# attrgetters read all source fields in one C-level call.
+_GENERIC_ATTRS = tuple(GenericOSCMappingItem.__annotations__)
+_MAPPING_ATTRS = tuple(OSCMappingItem.__annotations__)
+_GENERIC_GETTER = operator.attrgetter(*_GENERIC_ATTRS)
+_MAPPING_GETTER = operator.attrgetter(*_MAPPING_ATTRS)
+
+
+def _duplicate_item(coll, src_idx, attrs, getter):
+    """
+    Copy entry src_idx of coll into a new entry and return it.
+
+    Shared by the two duplicate operators, which only differ in their
+    collection and PropertyGroup. The source fields are read with the
+    precomputed attrgetter before coll.add(), since growing the
+    collection can reallocate it and invalidate the source reference.
+
+    Returns:
+        The new entry, or None when src_idx is out of range.
+    """
+    if src_idx < 0:
+        return None
+
+    try:
+        src = coll[src_idx]
+    except IndexError:
+        return None
+
+    values = getter(src)
+    dst = coll.add()
+
+    for attr, value in zip(attrs, values):
+        setattr(dst, attr, value)
+
+    return dst
+
+
+# Translation table that strips '_' and ' ' from property identifiers
+# when deriving compact OSC addresses; built once at import time
+_ADDR_CLEAN = str.maketrans('', '', '_ ')
+
+# Datablock type -> bpy.data collection name used when building full
+# paths; hoisted so build_full_path does not rebuild the dict per call
+_TYPE_TO_COLLECTION = {
+    'MESH': 'meshes',
+    'MATERIAL': 'materials',
+    'TEXTURE': 'textures',
+    'IMAGE': 'images',
+    'ARMATURE': 'armatures',
+}
+
+# Geometry-Nodes-modifier verdict per Python class: the answer only
+# depends on the type, so repeated right-clicks on the same kind of
+# datablock reduce to one dict lookup
+_GN_MOD_CACHE = {}
+
+# Memoized build_full_path results keyed by (pointer, datablock name,
+# data_path). as_pointer() is stable for the session (unlike id() of the
+# short-lived RNA wrappers) and the name in the key retires entries when
+# a datablock is renamed. Cleared on file load via _on_load_post_paths.
+_FULL_PATH_CACHE = {}
+
+
+@bpy.app.handlers.persistent
+def _on_load_post_paths(_dummy):
+    """load_post handler: pointers from the previous file are meaningless."""
+    _FULL_PATH_CACHE.clear()
 
 
 # ------------------------------------------------------------------------------------------------------
@@ -46,8 +120,14 @@ class OSC_OT_CreateMappingFromProperty(bpy.types.Operator):
         """
         Only enable this operator when Blender provides button_pointer
         and button_prop in the context (i.e. when right-clicking a UI property).
+
+        poll runs on every menu draw, so the checks use getattr with a
+        default instead of hasattr's try/except machinery.
         """
-        return hasattr(context, 'button_pointer') and hasattr(context, 'button_prop')
+        return (
+            getattr(context, 'button_pointer', None) is not None
+            and getattr(context, 'button_prop', None) is not None
+        )
     
     def execute(self, context):
         # These attributes are provided by Blender for the clicked property
@@ -84,16 +164,14 @@ class OSC_OT_CreateMappingFromProperty(bpy.types.Operator):
             
             # Initialize default in/out ranges based on the property metadata
             self.set_default_ranges(item, button_prop)
+
+            # Make sure the OSC server picks up the new mapping
+            invalidate_mapping_cache()
             
-            # Force UI refresh so the new mapping appears immediately in the N-panel
-            wm = bpy.context.window_manager
-            for window in wm.windows:
-                screen = window.screen
-                for area in screen.areas:
-                    if area.type == 'VIEW_3D':
-                        for region in area.regions:
-                            if region.type == 'UI':
-                                region.tag_redraw()
+            # Throttled UI refresh so the new mapping appears in the
+            # N-panel; imported lazily to keep ui out of registration
+            from ..ui.panels import request_redraw
+            request_redraw()
 
             self.report({'INFO'}, f"Mapping OSC created: {osc_address} -> {full_path}")
             return {'FINISHED'}
@@ -113,20 +191,29 @@ class OSC_OT_CreateMappingFromProperty(bpy.types.Operator):
 
         Blender exposes different types for Geometry Nodes modifiers depending
         on context, so several checks are used (type name, bl_rna identifier,
-        presence of node_group / type == 'NODES').
+        presence of node_group / type == 'NODES'). The verdict is cached per
+        Python class since it only depends on the type.
         """
-        type_str = str(type(obj))
-        if 'NodesModifier' in type_str:
-            return True
-        
-        if hasattr(obj, 'bl_rna') and hasattr(obj.bl_rna, 'identifier'):
-            return 'NodesModifier' in obj.bl_rna.identifier
-        
-        return (
-            hasattr(obj, 'node_group') 
-            and hasattr(obj, 'type') 
-            and getattr(obj, 'type', '') == 'NODES'
-        )
+        t = type(obj)
+        hit = _GN_MOD_CACHE.get(t)
+        if hit is not None:
+            return hit
+
+        # getattr with defaults instead of hasattr probing; the RNA
+        # identifier also covers what the old str(type(obj)) scan caught
+        bl_rna = getattr(obj, 'bl_rna', None)
+        ident = bl_rna.identifier if bl_rna is not None else ''
+
+        if 'NodesModifier' in ident:
+            result = True
+        else:
+            result = (
+                getattr(obj, 'node_group', None) is not None
+                and getattr(obj, 'type', '') == 'NODES'
+            )
+
+        _GN_MOD_CACHE[t] = result
+        return result
 
     def handle_geometry_nodes_modifier(self, modifier, button_prop):
         """
@@ -137,20 +224,23 @@ class OSC_OT_CreateMappingFromProperty(bpy.types.Operator):
             (full_path, osc_address)
         """
         try:
-            obj_id = modifier.id_data if hasattr(modifier, 'id_data') else None
-            if not obj_id or not hasattr(obj_id, 'name'):
+            # getattr with defaults: these attributes exist on any real
+            # modifier, so no hasattr try/except probing is needed
+            obj_id = getattr(modifier, 'id_data', None)
+            object_name = getattr(obj_id, 'name', None)
+            if not object_name:
                 raise ValueError("Parent object could not be found")
-            
-            object_name = obj_id.name
-            modifier_name = modifier.name if hasattr(modifier, 'name') else 'GeometryNodes'
+
+            modifier_name = getattr(modifier, 'name', 'GeometryNodes')
             socket_identifier = button_prop.identifier
             
             # Example full_path:
             # bpy.data.objects['Cube'].modifiers['GeometryNodes']["Socket_001"]
             full_path = f"bpy.data.objects['{object_name}'].modifiers['{modifier_name}']['{socket_identifier}']"
             
-            # Try to create a cleaner OSC address from the socket name
-            clean_socket = socket_identifier.replace('Socket_', '').replace('_', '')
+            # Try to create a cleaner OSC address from the socket name;
+            # removeprefix + the shared translate table do it in one pass
+            clean_socket = socket_identifier.removeprefix('Socket_').translate(_ADDR_CLEAN)
             if not clean_socket:
                 clean_socket = f"socket{socket_identifier[-1]}" if socket_identifier[-1].isdigit() else "param"
             
@@ -171,22 +261,51 @@ class OSC_OT_CreateMappingFromProperty(bpy.types.Operator):
         - bpy.data.materials['Mat'].node_tree.nodes["Node"].inputs[0].default_value
         - bpy.data.objects['Cube'].location[0]
         - bpy.context.object.location[0] (fallback)
+
+        Results are memoized in _FULL_PATH_CACHE: the RNA introspection
+        below is stable for a given datablock within a session, and
+        creating several mappings on the same object repeats it.
         """
         obj_id = obj.id_data if hasattr(obj, 'id_data') else obj
-        
+
+        try:
+            key = (obj.as_pointer(), getattr(obj_id, 'name', None), data_path)
+        except AttributeError:
+            # Not a bpy_struct: compute without caching
+            key = None
+
+        if key is not None:
+            cached = _FULL_PATH_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        full_path = self._build_full_path_uncached(obj, obj_id, data_path)
+
+        if key is not None:
+            _FULL_PATH_CACHE[key] = full_path
+
+        return full_path
+
+    def _build_full_path_uncached(self, obj, obj_id, data_path):
+        """Uncached path construction; see build_full_path."""
+
         # --------------------------------------------------------------
         # Special case: nodes / sockets in a node editor
         # --------------------------------------------------------------
-        if hasattr(obj, 'bl_rna') and any(x in str(obj.bl_rna.identifier) for x in ['Node', 'Socket']):
+        ident = obj.bl_rna.identifier if hasattr(obj, 'bl_rna') else ''
+        if 'Node' in ident or 'Socket' in ident:
             if hasattr(obj, 'id_data') and hasattr(obj.id_data, 'bl_rna'):
                 node_group_name = obj.id_data.name
+                tree_ident = obj.id_data.bl_rna.identifier
 
-                # Geometry Node tree in bpy.data.node_groups
-                if 'GeometryNodeTree' in str(obj.id_data.bl_rna.identifier):
+                # Geometry Node tree in bpy.data.node_groups; RNA tree
+                # identifiers start with these tokens, so startswith
+                # replaces the full substring scan
+                if tree_ident.startswith('GeometryNodeTree'):
                     return f"bpy.data.node_groups['{node_group_name}'].{data_path}"
-                
+
                 # Shader Node tree: assume it belongs to a material
-                elif 'ShaderNodeTree' in str(obj.id_data.bl_rna.identifier):
+                elif tree_ident.startswith('ShaderNodeTree'):
                     return f"bpy.data.materials['{node_group_name}'].node_tree.{data_path}"
                 
                 # Fallback: generic node group
@@ -205,14 +324,7 @@ class OSC_OT_CreateMappingFromProperty(bpy.types.Operator):
             
             # Datablocks with a 'type' attribute (MESH, MATERIAL, etc.)
             elif hasattr(obj_id, 'type'):
-                type_map = {
-                    'MESH': 'meshes',
-                    'MATERIAL': 'materials',
-                    'TEXTURE': 'textures',
-                    'IMAGE': 'images',
-                    'ARMATURE': 'armatures'
-                }
-                collection = type_map.get(obj_id.type, 'objects')
+                collection = _TYPE_TO_COLLECTION.get(obj_id.type, 'objects')
                 return f"bpy.data.{collection}['{obj_name}'].{data_path}"
 
         # Fallback: rely on the active context object
@@ -227,12 +339,23 @@ class OSC_OT_CreateMappingFromProperty(bpy.types.Operator):
             prop_name: 'location'
             result:    "/Cube/location"
         """
-        # First quoted name (e.g. object name) becomes the OSC "target"
-        obj_match = re.search(r"[\'\"]([^\'\"]+)[\'\"]", data_path)
-        obj_name = obj_match.group(1) if obj_match else "object"
+        # First quoted name (e.g. object name) becomes the OSC "target";
+        # located with str.find since no pattern matching is needed
+        i = data_path.find("'")
+        j = data_path.find('"')
+        if i < 0 or 0 <= j < i:
+            i, quote = j, '"'
+        else:
+            quote = "'"
+
+        obj_name = "object"
+        if i >= 0:
+            j = data_path.find(quote, i + 1)
+            if j > i:
+                obj_name = data_path[i + 1:j]
 
         # Clean the property identifier for a compact OSC path
-        clean_prop = prop_name.replace('_', '').replace(' ', '')
+        clean_prop = prop_name.translate(_ADDR_CLEAN)
 
         return f"/{obj_name}/{clean_prop}"
     
@@ -274,6 +397,7 @@ class OSC_OT_AddGenericMapping(bpy.types.Operator):
         item.address = "/param"
         item.data_path = "bpy.context.object.location[0]"
         item.fold = False
+        invalidate_mapping_cache()
         return {'FINISHED'}
 
 
@@ -291,19 +415,15 @@ class OSC_OT_DuplicateGenericMapping(bpy.types.Operator):
     index: bpy.props.IntProperty(default=-1)
     
     def execute(self, context):
-        scn = context.scene
-        src_idx = self.index
-
-        if 0 <= src_idx < len(scn.osc_generic_mappings):
-            src = scn.osc_generic_mappings[src_idx]
-            dst = scn.osc_generic_mappings.add()
+        dst = _duplicate_item(
+            context.scene.osc_generic_mappings, self.index,
+            _GENERIC_ATTRS, _GENERIC_GETTER,
+        )
 
-            # Copy every annotated property from source to destination            
-            for attr in src.__annotations__.keys():
-                setattr(dst, attr, getattr(src, attr))
-            
+        if dst is not None:
             # Ensure the duplicated mapping is visible (unfolded)
             dst.fold = False
+            invalidate_mapping_cache()
 
         return {'FINISHED'}
 
@@ -319,11 +439,17 @@ class OSC_OT_RemoveGenericMapping(bpy.types.Operator):
     index: bpy.props.IntProperty(default=-1)
     
     def execute(self, context):
-        scn = context.scene
+        coll = context.scene.osc_generic_mappings
         idx = self.index
 
-        if 0 <= idx < len(scn.osc_generic_mappings):
-            scn.osc_generic_mappings.remove(idx)
+        # EAFP: try the remove directly instead of paying a len() RNA
+        # crossing first; out-of-range indices just do nothing
+        if idx >= 0:
+            try:
+                coll.remove(idx)
+            except (IndexError, RuntimeError):
+                return {'FINISHED'}
+            invalidate_mapping_cache()
 
         return {'FINISHED'}
 
@@ -339,11 +465,15 @@ class OSC_OT_ToggleGenericFold(bpy.types.Operator):
     index: bpy.props.IntProperty(default=-1)
     
     def execute(self, context):
-        scn = context.scene
+        coll = context.scene.osc_generic_mappings
         i = self.index
 
-        if 0 <= i < len(scn.osc_generic_mappings):
-            scn.osc_generic_mappings[i].fold = not scn.osc_generic_mappings[i].fold
+        if i >= 0:
+            try:
+                item = coll[i]
+                item.fold = not item.fold
+            except (IndexError, RuntimeError):
+                pass
 
         return {'FINISHED'}
 
@@ -352,6 +482,28 @@ class OSC_OT_ToggleGenericFold(bpy.types.Operator):
 # Shape key mappings operators (character facial set, etc.)
 # ------------------------------------------------------------------------
 
+# Standard face shape key names (ARKit/MetaHuman style), allocated once
+# at import time instead of per bulk-add invocation
+_FACE_SHAPE_KEYS = (
+    "eyeLookUpLeft", "eyeLookUpRight", "eyeLookDownLeft", "eyeLookDownRight",
+    "eyeLookInLeft", "eyeLookInRight", "eyeLookOutLeft", "eyeLookOutRight",
+    "eyeBlinkLeft", "eyeBlinkRight", "eyeSquintLeft", "eyeSquintRight",
+    "eyeWideLeft", "eyeWideRight", "jawForward", "jawLeft", "jawRight", "jawOpen",
+    "mouthClose", "mouthFunnel", "mouthPucker", "mouthLeft", "mouthRight",
+    "mouthSmileLeft", "mouthSmileRight", "mouthFrownLeft", "mouthFrownRight",
+    "mouthDimpleLeft", "mouthDimpleRight", "mouthStretchLeft", "mouthStretchRight",
+    "mouthRollLower", "mouthRollUpper", "mouthShrugUpper", "mouthShrugLower",
+    "mouthPressLeft", "mouthPressRight", "mouthLowerDownLeft", "mouthLowerDownRight",
+    "mouthUpperUpLeft", "mouthUpperUpRight", "browDownLeft", "browDownRight",
+    "browInnerUp", "browOuterUpLeft", "browOuterUpRight", "cheekPuff",
+    "cheekSquintLeft", "cheekSquintRight", "noseSneerLeft", "noseSneerRight",
+)
+
+# Matching OSC addresses ("/" + name), concatenated once at import time
+# so the bulk loop just hands finished strings to the RNA setter
+_FACE_ADDRS = tuple("/" + sk for sk in _FACE_SHAPE_KEYS)
+
+
 class OSC_OT_AddBulkMappings(bpy.types.Operator):
     """
     Create a full set of standard face shape key mappings in one click.
@@ -371,31 +523,29 @@ class OSC_OT_AddBulkMappings(bpy.types.Operator):
     )
 
     def execute(self, context):
-        # List of standard face shape key names
-        shape_keys = [
-            "eyeLookUpLeft", "eyeLookUpRight", "eyeLookDownLeft", "eyeLookDownRight",
-            "eyeLookInLeft", "eyeLookInRight", "eyeLookOutLeft", "eyeLookOutRight",
-            "eyeBlinkLeft", "eyeBlinkRight", "eyeSquintLeft", "eyeSquintRight",
-            "eyeWideLeft", "eyeWideRight", "jawForward", "jawLeft", "jawRight", "jawOpen",
-            "mouthClose", "mouthFunnel", "mouthPucker", "mouthLeft", "mouthRight",
-            "mouthSmileLeft", "mouthSmileRight", "mouthFrownLeft", "mouthFrownRight",
-            "mouthDimpleLeft", "mouthDimpleRight", "mouthStretchLeft", "mouthStretchRight",
-            "mouthRollLower", "mouthRollUpper", "mouthShrugUpper", "mouthShrugLower",
-            "mouthPressLeft", "mouthPressRight", "mouthLowerDownLeft", "mouthLowerDownRight",
-            "mouthUpperUpLeft", "mouthUpperUpRight", "browDownLeft", "browDownRight",
-            "browInnerUp", "browOuterUpLeft", "browOuterUpRight", "cheekPuff",
-            "cheekSquintLeft", "cheekSquintRight", "noseSneerLeft", "noseSneerRight"
-        ]
-
-        scn = context.scene
-
-        for sk in shape_keys:
-            item = scn.osc_mappings.add()
-            item.address = "/" + sk
-            item.object_name = self.mesh_name
-            item.shapekey_name = sk
-            item.fold = False
+        from ..ui.panels import begin_bulk_edit, end_bulk_edit
+
+        coll = context.scene.osc_mappings
+        mesh_name = self.mesh_name
 
+        # CollectionProperty has no bulk resize, so add() runs per entry;
+        # all field writes for one item stay together and 'fold' keeps its
+        # default (False) instead of paying an extra RNA write per row.
+        # Redraw flushes are held back for the whole batch and released
+        # once at the end by end_bulk_edit().
+        begin_bulk_edit()
+        try:
+            for sk, addr in zip(_FACE_SHAPE_KEYS, _FACE_ADDRS):
+                item = coll.add()
+                item.address = addr
+                item.object_name = mesh_name
+                item.shapekey_name = sk
+        finally:
+            end_bulk_edit()
+
+        # One cache invalidation for the whole batch; the per-assignment
+        # update callbacks already fired but this is the one that matters
+        invalidate_mapping_cache()
         self.report({'INFO'}, "Mappings shape keys added.")
         return {'FINISHED'}
 
@@ -415,6 +565,7 @@ class OSC_OT_AddMapping(bpy.types.Operator):
         item = context.scene.osc_mappings.add()
         item.address = "/param"
         item.fold = False
+        invalidate_mapping_cache()
         return {'FINISHED'}
 
 class OSC_OT_DuplicateMapping(bpy.types.Operator):
@@ -431,19 +582,15 @@ class OSC_OT_DuplicateMapping(bpy.types.Operator):
     index: bpy.props.IntProperty(default=-1)
     
     def execute(self, context):
-        scn = context.scene
-        src_idx = self.index
-
-        if 0 <= src_idx < len(scn.osc_mappings):
-            src = scn.osc_mappings[src_idx]
-            dst = scn.osc_mappings.add()
-
-            # Copy field by field using annotations as the source of truth
-            for attr in src.__annotations__.keys():
-                setattr(dst, attr, getattr(src, attr))
+        dst = _duplicate_item(
+            context.scene.osc_mappings, self.index,
+            _MAPPING_ATTRS, _MAPPING_GETTER,
+        )
 
+        if dst is not None:
             # Make the duplicated mapping unfolded for editing
             dst.fold = False
+            invalidate_mapping_cache()
 
         return {'FINISHED'}
 
@@ -459,11 +606,17 @@ class OSC_OT_RemoveMapping(bpy.types.Operator):
     index: bpy.props.IntProperty(default=-1)
 
     def execute(self, context):
-        scn = context.scene
+        coll = context.scene.osc_mappings
         idx = self.index
 
-        if 0 <= idx < len(scn.osc_mappings):
-            scn.osc_mappings.remove(idx)
+        # EAFP: try the remove directly instead of paying a len() RNA
+        # crossing first; out-of-range indices just do nothing
+        if idx >= 0:
+            try:
+                coll.remove(idx)
+            except (IndexError, RuntimeError):
+                return {'FINISHED'}
+            invalidate_mapping_cache()
 
         return {'FINISHED'}
 
@@ -478,11 +631,15 @@ class OSC_OT_ToggleFold(bpy.types.Operator):
     index: bpy.props.IntProperty(default=-1)
 
     def execute(self, context):
-        scn = context.scene
+        coll = context.scene.osc_mappings
         i = self.index
 
-        if 0 <= i < len(scn.osc_mappings):
-            scn.osc_mappings[i].fold = not scn.osc_mappings[i].fold
+        if i >= 0:
+            try:
+                item = coll[i]
+                item.fold = not item.fold
+            except (IndexError, RuntimeError):
+                pass
 
         return {'FINISHED'}
 
@@ -504,14 +661,22 @@ classes = (
     OSC_OT_ToggleFold,
 )
 
+# Batched (un)registration functions generated by Blender
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
+
+    # Reset the memoized full paths when a different file is loaded
+    if _on_load_post_paths not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post_paths)
 
 def unregister():
-    for cls in reversed(classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except:
-            # In case some classes were not registered for any reason
-            pass
+    if _on_load_post_paths in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post_paths)
+
+    try:
+        _unregister_classes()
+    except RuntimeError:
+        # Some class was not registered (e.g. partial enable/disable)
+        pass
@@ -44,13 +44,14 @@ class OSC_OT_Start(bpy.types.Operator):
             # start_server returns a string on error (e.g. port in use)
             self.report({'ERROR'}, err)
             return {'CANCELLED'}
-        
-        # Install the timer handler once per scene to drive OSC updates
-        if not getattr(scn, "_osc_timer_installed", False):
+
+        # Install the timer handler to drive OSC updates. The callback
+        # unregisters itself (returns None) on its first tick after the
+        # server stops, so is_registered is the authoritative state; a
+        # module flag would go stale because that tick runs after Stop.
+        if not bpy.app.timers.is_registered(osc_timer_step_extended):
             bpy.app.timers.register(osc_timer_step_extended, first_interval=0.01, persistent=True)
-            # Use a custom property on the Scene to remember that the timer is active
-            scn["_osc_timer_installed"] = True
-        
+
         self.report({'INFO'}, f"OSC server listening on {scn.osc_ip}:{scn.osc_port}")
         return {'FINISHED'}
 
@@ -67,6 +68,7 @@ class OSC_OT_Stop(bpy.types.Operator):
 
     def execute(self, context):
         stop_server()
+
         self.report({'INFO'}, "OSC stopped")
         return {'FINISHED'}
 
@@ -79,14 +81,15 @@ classes = (
     OSC_OT_Stop,
 )
 
+# Batched (un)registration functions generated by Blender
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
 
 def unregister():
-    for cls in reversed(classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except:
-            # Safe guard in case of partial registration
-            pass
+    try:
+        _unregister_classes()
+    except RuntimeError:
+        # Safe guard in case of partial registration
+        pass
@@ -23,42 +23,126 @@ import bpy
 
 
 # ------------------------------------------------------------------------
-# Property groups for OSC mappings
+# Update callbacks
 # ------------------------------------------------------------------------
 
-class GenericOSCMappingItem(bpy.types.PropertyGroup):
+def _on_mapping_update(self, context):
     """
-    PropertyGroup representing a generic OSC mapping that targets
-    any Blender property via a RNA data_path.
+    Update callback shared by all mapping-relevant properties.
 
-    These entries are stored in Scene.osc_generic_mappings and are
-    typically created either manually in the UI or via the
-    "Create Mapping From Property" operator.
+    Invalidates the cached mapping table in core/osc_server.py so the
+    next timer tick picks up the edited values. Imported lazily to avoid
+    pulling the server module in at registration time.
+    """
+    from ..core.osc_server import invalidate_mapping_cache
+    invalidate_mapping_cache()
+
+
+def _on_data_path_change(self, context):
+    """
+    Update callback for data_path.
+
+    Besides the usual cache invalidation, precomputes the short label
+    shown in the mapping list (the tail of the path) so draw() does not
+    re-split the string on every redraw of every row.
+    """
+    value = self.data_path
+    self.data_path_short = value.rsplit('.', 1)[-1] if value else "(Property)"
+    _on_mapping_update(self, context)
+
+
+def _ensure_address_default(self, context):
+    """
+    Update callback for address.
+
+    Re-seeds the "/param" placeholder when the field is cleared, so the
+    UI lists can draw item.address directly without a per-row fallback
+    branch, then invalidates the caches like any other mapping edit.
+    """
+    if not self.address:
+        # Writing the value re-enters this callback once; the nested
+        # call sees a non-empty address and only invalidates
+        self.address = "/param"
+    _on_mapping_update(self, context)
+
+
+@bpy.app.handlers.persistent
+def _on_load_post_normalize(_dummy):
     """
+    Normalize mapping rows loaded from older files.
+
+    data_path_short is only written by the data_path update callback,
+    which never fires for rows already stored in a .blend; files saved
+    before the cached label existed would show its bare default in the
+    list until the user re-edited the path. The same goes for empty
+    addresses: the "/param" re-seed only runs on edits, and the UI lists
+    draw item.address without a fallback, so rows saved with a cleared
+    address would render blank. Both are normalized here.
+    """
+    for scn in bpy.data.scenes:
+        for item in scn.osc_mappings:
+            if not item.address:
+                item.address = "/param"
+
+        for item in scn.osc_generic_mappings:
+            if not item.address:
+                item.address = "/param"
+            if item.data_path:
+                item.data_path_short = item.data_path.rsplit('.', 1)[-1]
 
-    # OSC address, e.g. "/Camera/FocalLength"
-    address: bpy.props.StringProperty(name="Address", default="/param")
 
-    # Full Python/RNA path to the target property
-    # e.g. "bpy.data.objects['Cube'].location[0]"
-    data_path: bpy.props.StringProperty(name="Data Path")
+# ------------------------------------------------------------------------
+# Property groups for OSC mappings
+# ------------------------------------------------------------------------
+
+# Property declarations shared by both mapping PropertyGroups. The
+# bpy.props.* calls only build (function, keywords) spec tuples, so one
+# dict at module import covers both classes; Blender reads each class's
+# __annotations__ at registration time.
+_COMMON_ANNOTATIONS = {
+    # OSC address, e.g. "/Camera/FocalLength" or "/mouthSmileLeft"
+    'address': bpy.props.StringProperty(name="Address", default="/param", update=_ensure_address_default),
 
     # Input range expected from the OSC source
-    min_in: bpy.props.FloatProperty(name="Min In", default=0.0)
-    max_in: bpy.props.FloatProperty(name="Max In", default=1.0)
+    'min_in': bpy.props.FloatProperty(name="Min In", default=0.0, update=_on_mapping_update),
+    'max_in': bpy.props.FloatProperty(name="Max In", default=1.0, update=_on_mapping_update),
 
-    # Output range to apply on the Blender property
-    min_out: bpy.props.FloatProperty(name="Min Out", default=0.0)
-    max_out: bpy.props.FloatProperty(name="Max Out", default=1.0)
+    # Output range to apply on the target property
+    'min_out': bpy.props.FloatProperty(name="Min Out", default=0.0, update=_on_mapping_update),
+    'max_out': bpy.props.FloatProperty(name="Max Out", default=1.0, update=_on_mapping_update),
 
     # Clamp the normalized input to [0, 1]
-    clamp: bpy.props.BoolProperty(name="Clamp", default=True)
+    'clamp': bpy.props.BoolProperty(name="Clamp", default=True, update=_on_mapping_update),
 
     # Invert the normalized value (1 - t)
-    invert: bpy.props.BoolProperty(name="Invert", default=False)
+    'invert': bpy.props.BoolProperty(name="Invert", default=False, update=_on_mapping_update),
 
     # UI state: whether this mapping row is folded/collapsed
-    fold: bpy.props.BoolProperty(name="Fold", default=False)
+    'fold': bpy.props.BoolProperty(name="Fold", default=False),
+}
+
+
+class GenericOSCMappingItem(bpy.types.PropertyGroup):
+    """
+    PropertyGroup representing a generic OSC mapping that targets
+    any Blender property via a RNA data_path.
+
+    These entries are stored in Scene.osc_generic_mappings and are
+    typically created either manually in the UI or via the
+    "Create Mapping From Property" operator.
+    """
+
+    __annotations__ = {
+        **_COMMON_ANNOTATIONS,
+
+        # Full Python/RNA path to the target property
+        # e.g. "bpy.data.objects['Cube'].location[0]"
+        'data_path': bpy.props.StringProperty(name="Data Path", update=_on_data_path_change),
+
+        # Short label for the UI list (tail of data_path), kept in sync by
+        # _on_data_path_change instead of being re-derived per redraw
+        'data_path_short': bpy.props.StringProperty(name="Property", default="(Property)"),
+    }
 
 class OSCMappingItem(bpy.types.PropertyGroup):
     """
@@ -71,47 +155,33 @@ class OSCMappingItem(bpy.types.PropertyGroup):
     These entries are stored in Scene.osc_mappings.
     """
 
-    # OSC address, e.g. "/mouthSmileLeft"
-    address: bpy.props.StringProperty(name="Address", default="/param")
+    __annotations__ = {
+        **_COMMON_ANNOTATIONS,
 
-    # Target mesh object and shape key
-    object_name: bpy.props.StringProperty(name="Object")
-    shapekey_name: bpy.props.StringProperty(name="Shape Key")
+        # Target mesh object and shape key
+        'object_name': bpy.props.StringProperty(name="Object", update=_on_mapping_update),
+        'shapekey_name': bpy.props.StringProperty(name="Shape Key", update=_on_mapping_update),
 
-    # Optional armature and bone for rotation-based mappings
-    armature_name: bpy.props.StringProperty(name="Armature")
-    bone_name: bpy.props.StringProperty(name="Bone")
-    
-    # Axis used for the rotation mapping
-    rotation_axis: bpy.props.EnumProperty(
-        name="Axe",
-        items=[('X', 'X', ''), ('Y', 'Y', ''), ('Z', 'Z', '')],
-        default='X'
-    )
-
-    # Rotation mode used when applying the value to the bone
-    rotation_mode: bpy.props.EnumProperty(
-        name="Mode",
-        items=[('EULER', 'Euler', ''), ('QUATERNION', 'Quaternion', '')],
-        default='EULER'
-    )
-    
-    # Input range expected from the OSC source
-    min_in: bpy.props.FloatProperty(name="Min In", default=0.0)
-    max_in: bpy.props.FloatProperty(name="Max In", default=1.0)
-
-    # Output range for the shape key value or rotation
-    min_out: bpy.props.FloatProperty(name="Min Out", default=0.0)
-    max_out: bpy.props.FloatProperty(name="Max Out", default=1.0)
+        # Optional armature and bone for rotation-based mappings
+        'armature_name': bpy.props.StringProperty(name="Armature", update=_on_mapping_update),
+        'bone_name': bpy.props.StringProperty(name="Bone", update=_on_mapping_update),
 
-    # Clamp normalized input to [0, 1]
-    clamp: bpy.props.BoolProperty(name="Clamp", default=True)
+        # Axis used for the rotation mapping
+        'rotation_axis': bpy.props.EnumProperty(
+            name="Axe",
+            items=[('X', 'X', ''), ('Y', 'Y', ''), ('Z', 'Z', '')],
+            default='X',
+            update=_on_mapping_update
+        ),
 
-    # Invert normalized value (1 - t)
-    invert: bpy.props.BoolProperty(name="Invert", default=False)
-
-    # UI state: whether this mapping row is folded/collapsed
-    fold: bpy.props.BoolProperty(name="Fold", default=False)
+        # Rotation mode used when applying the value to the bone
+        'rotation_mode': bpy.props.EnumProperty(
+            name="Mode",
+            items=[('EULER', 'Euler', ''), ('QUATERNION', 'Quaternion', '')],
+            default='EULER',
+            update=_on_mapping_update
+        ),
+    }
 
 
 # ------------------------------------------------------------------------
@@ -124,6 +194,21 @@ classes = (
     OSCMappingItem,
 )
 
+# Scene attributes attached in register(), removed in unregister();
+# module-level so the tuple is not rebuilt on each disable/reload
+_SCENE_ATTRS = (
+    'osc_ip', 'osc_port', 'osc_autokey',
+    'osc_mappings', 'osc_generic_mappings',
+    'osc_mappings_active_index', 'osc_generic_mappings_active_index',
+)
+
+# Batched (un)registration functions generated by Blender
+_register_cls, _unregister_cls = bpy.utils.register_classes_factory(classes)
+
+# True while this module is registered; dev-reload cycles can call
+# register() twice and this skips the RNA "already registered" raise
+_registered = False
+
 def register():
     """
     Register PropertyGroup classes and attach custom properties to Scene.
@@ -134,10 +219,14 @@ def register():
         - osc_mappings: collection of OSCMappingItem
         - osc_generic_mappings: collection of GenericOSCMappingItem
     """
+    global _registered
+
+    if _registered:
+        return
+
     # Register PropertyGroup classes
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    
+    _register_cls()
+
     # Scene properties (shared by all scenes in the file)
     scn = bpy.types.Scene
 
@@ -152,24 +241,43 @@ def register():
     scn.osc_mappings = bpy.props.CollectionProperty(type=OSCMappingItem)
     scn.osc_generic_mappings = bpy.props.CollectionProperty(type=GenericOSCMappingItem)
 
+    # Active row of each mapping list (used by the UILists in ui/panels.py)
+    scn.osc_mappings_active_index = bpy.props.IntProperty(name="Active Mapping", default=0)
+    scn.osc_generic_mappings_active_index = bpy.props.IntProperty(name="Active Generic Mapping", default=0)
+
+    # Fix up mapping rows coming from files saved by older versions
+    if _on_load_post_normalize not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post_normalize)
+
+    _registered = True
+
 def unregister():
     """
     Remove custom properties from Scene and unregister classes.
 
     This is called from the add-on's main unregister() function.
     """
-    # Remove Scene-level properties defined in register()
+    global _registered
+
+    if _on_load_post_normalize in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post_normalize)
+
+    # Remove Scene-level properties defined in register(); the delattr
+    # attempt replaces the separate hasattr probe (one RNA lookup each)
     scn = bpy.types.Scene
-    attrs = ['osc_ip', 'osc_port', 'osc_autokey', 'osc_mappings', 'osc_generic_mappings']
 
-    for attr in attrs:
-        if hasattr(scn, attr):
-            delattr(scn, attr)
-    
-    # Unregister PropertyGroup classes in reverse order
-    for cls in reversed(classes):
+    for attr in _SCENE_ATTRS:
         try:
-            bpy.utils.unregister_class(cls)
-        except:
-            # In case some class was not registered for any reason
+            delattr(scn, attr)
+        except AttributeError:
+            # The property was never attached (partial registration)
             pass
+    
+    # Unregister PropertyGroup classes (reverse order inside the factory)
+    try:
+        _unregister_cls()
+    except RuntimeError:
+        # In case some class was not registered for any reason
+        pass
+
+    _registered = False
@@ -20,7 +20,178 @@ Defines the main OSC UI panel in the 3D View (N-panel):
 
 import bpy
 
-from ..core.osc_server import osc_state
+from ..core.osc_server import osc_state, add_state_listener, remove_state_listener
+
+
+# Last server state seen via the listener below; draw() reads this
+# module global instead of osc_state.running on every redraw, and the
+# panel is only re-tagged on actual start/stop transitions.
+_server_running = False
+
+
+def _on_server_state(running):
+    """State listener: cache the new state and refresh the button row."""
+    global _server_running
+
+    if running != _server_running:
+        _server_running = running
+        request_redraw()
+
+
+# ------------------------------------------------------------------------
+# Throttled redraw requests
+# ------------------------------------------------------------------------
+
+# Seconds between redraw flushes (~10 Hz); OSC traffic can request
+# redraws at hundreds of Hz, the timer coalesces them to this rate
+_REDRAW_INTERVAL = 0.1
+
+# True while at least one redraw request is waiting for the next flush
+_redraw_pending = False
+
+# True while a bulk operator is populating a mapping collection; the
+# flush timer holds back during that window so the whole batch costs a
+# single redraw instead of one per appended row
+_bulk_in_progress = False
+
+
+def begin_bulk_edit():
+    """Suspend redraw flushes for the duration of a bulk mapping edit."""
+    global _bulk_in_progress
+    _bulk_in_progress = True
+
+
+def end_bulk_edit():
+    """Resume redraw flushes and request one refresh for the batch."""
+    global _bulk_in_progress
+    _bulk_in_progress = False
+    request_redraw()
+
+
+def request_redraw():
+    """
+    Ask for a refresh of the OSC panel areas.
+
+    Callers only set a flag; _flush_redraw tags the UI regions at most
+    once per _REDRAW_INTERVAL, so draw() cost is bounded by the timer
+    rate instead of the OSC message rate.
+    """
+    global _redraw_pending
+    _redraw_pending = True
+
+
+def _flush_redraw():
+    """Timer body: tag the 3D View UI regions if a redraw is pending."""
+    global _redraw_pending
+
+    if _redraw_pending and not _bulk_in_progress:
+        _redraw_pending = False
+
+        wm = bpy.context.window_manager
+        if wm is not None:
+            for window in wm.windows:
+                for area in window.screen.areas:
+                    if area.type == 'VIEW_3D':
+                        for region in area.regions:
+                            if region.type == 'UI':
+                                region.tag_redraw()
+
+    return _REDRAW_INTERVAL
+
+
+def _filter_by_address(ul, data, propname):
+    """
+    filter_items body shared by both mapping UILists.
+
+    Reads all addresses in one comprehension (a single RNA get per row)
+    and runs the search on the resulting plain strings, so Blender can
+    skip filtered-out rows in C. An empty search box filters nothing.
+    """
+    pattern = ul.filter_name
+    if not pattern:
+        return [], []
+
+    pattern = pattern.lower()
+    flag = ul.bitflag_filter_item
+
+    addresses = [item.address for item in getattr(data, propname)]
+    return [flag if pattern in addr.lower() else 0 for addr in addresses], []
+
+
+# Row-renderer constants: draw_item runs once per visible row per
+# redraw, so the fold branch becomes a dict lookup and the operator
+# idnames/icons are shared string objects instead of per-call literals
+_ICON_FOLD = {True: "TRIA_RIGHT", False: "TRIA_DOWN"}
+
+_OP_TOGGLE = "osc_mapping.toggle_fold"
+_OP_DUP = "osc_mapping.duplicate"
+_OP_RM = "osc_mapping.remove"
+
+_OP_TOGGLE_GEN = "osc_mapping.toggle_generic_fold"
+_OP_DUP_GEN = "osc_mapping.duplicate_generic"
+_OP_RM_GEN = "osc_mapping.remove_generic"
+
+_ICON_DUP = "DUPLICATE"
+_ICON_RM = "X"
+
+
+class OSC_UL_ShapeKeyMappings(bpy.types.UIList):
+    """
+    Compact row renderer for Scene.osc_mappings.
+
+    template_list iterates the collection in C and only calls draw_item
+    for rows actually visible, so panel redraw cost no longer scales
+    with the total number of mappings. The built-in search box filters
+    rows by OSC address.
+    """
+
+    def filter_items(self, context, data, propname):
+        return _filter_by_address(self, data, propname)
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+
+        # Triangle icon indicates folded/expanded state of the detail block
+        row.operator(_OP_TOGGLE, text="", icon=_ICON_FOLD[item.fold], emboss=False).index = index
+
+        # OSC address, object name and shape key name as quick overview;
+        # address is never empty (its update callback re-seeds "/param")
+        row.label(text=item.address)
+        row.label(text=item.object_name if item.object_name else "(Object)")
+        row.label(text=item.shapekey_name if item.shapekey_name else "(ShapeKey)")
+
+        # Duplicate and remove buttons
+        row.operator(_OP_DUP, text="", icon=_ICON_DUP).index = index
+        row.operator(_OP_RM, text="", icon=_ICON_RM).index = index
+
+
+class OSC_UL_GenericMappings(bpy.types.UIList):
+    """
+    Compact row renderer for Scene.osc_generic_mappings, with the same
+    address search as the shape key list.
+    """
+
+    def filter_items(self, context, data, propname):
+        return _filter_by_address(self, data, propname)
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+
+        row.operator(_OP_TOGGLE_GEN, text="", icon=_ICON_FOLD[item.fold], emboss=False).index = index
+
+        # OSC address and the precomputed short form of the data_path
+        row.label(text=item.address)
+        row.label(text=item.data_path_short or "(Property)")
+
+        row.operator(_OP_DUP_GEN, text="", icon=_ICON_DUP).index = index
+        row.operator(_OP_RM_GEN, text="", icon=_ICON_RM).index = index
+
+
+# Static labels hoisted out of draw(); stored once as proper UTF-8
+# instead of being rebuilt (and possibly mis-decoded) per redraw
+_TIP_LINE_1 = "💡 Tip: Right-click on any property"
+_TIP_LINE_2 = "in Blender to create an OSC mapping!"
+_BULK_ADD_LABEL = "Ajouter 50 mappings ShapeKeys"
 
 
 class OSC_PT_Panel_Extended(bpy.types.Panel):
@@ -54,7 +225,7 @@ class OSC_PT_Panel_Extended(bpy.types.Panel):
         col.prop(scn, "osc_autokey")
 
         row = col.row(align=True)
-        if osc_state.running:
+        if _server_running:
             # When server is running, show a "Stop" button
             row.operator("osc_server.stop", text="Stop", icon="PAUSE")
         else:
@@ -68,28 +239,20 @@ class OSC_PT_Panel_Extended(bpy.types.Panel):
         # --------------------------------------------------------------
         layout.label(text="Shape Key Mappings", icon="SHAPEKEY_DATA")
 
-        for i, item in enumerate(scn.osc_mappings):
-            box = layout.box()
-
-            # Row header with fold toggle, labels and actions
-            header = box.row(align=True)
-
-            # Triangle icon indicates folded/expanded state
-            icon = "TRIA_RIGHT" if item.fold else "TRIA_DOWN"
-            op = header.operator("osc_mapping.toggle_fold", text="", icon=icon, emboss=False)
-            op.index = i
+        # Native list: iteration and scrolling happen in C, only visible
+        # rows are drawn
+        layout.template_list(
+            "OSC_UL_ShapeKeyMappings", "", scn, "osc_mappings",
+            scn, "osc_mappings_active_index", rows=6,
+        )
 
-            # Display OSC address, object name and shape key name as quick overview
-            header.label(text=item.address if item.address else "/param")
-            header.label(text=item.object_name if item.object_name else "(Object)")
-            header.label(text=item.shapekey_name if item.shapekey_name else "(ShapeKey)")
+        # Detailed properties of the active row only (when unfolded)
+        idx = scn.osc_mappings_active_index
+        if 0 <= idx < len(scn.osc_mappings):
+            item = scn.osc_mappings[idx]
 
-            # Duplicate and remove buttons
-            header.operator("osc_mapping.duplicate", text="", icon="DUPLICATE").index = i
-            header.operator("osc_mapping.remove", text="", icon="X").index = i
-
-            # If the item is unfolded, show all detailed properties
             if not item.fold:
+                box = layout.box()
                 box.prop(item, "address")
                 box.prop(item, "object_name")
                 box.prop(item, "shapekey_name")
@@ -111,7 +274,7 @@ class OSC_PT_Panel_Extended(bpy.types.Panel):
         layout.operator("osc_mapping.add", text="Add Shape Key Mapping", icon="ADD")
 
         # Convenience button to create a full set of facial shape key mappings
-        layout.operator("osc_mapping.add_bulk", text="Ajouter 50 mappings ShapeKeys", icon="PLUS")
+        layout.operator("osc_mapping.add_bulk", text=_BULK_ADD_LABEL, icon="PLUS")
         
         layout.separator()
         
@@ -120,27 +283,18 @@ class OSC_PT_Panel_Extended(bpy.types.Panel):
         # --------------------------------------------------------------
         layout.label(text="Generic Property Mappings", icon="PROPERTIES")
 
-        for i, item in enumerate(scn.osc_generic_mappings):
-            box = layout.box()
-
-            # Header row with fold toggle, short labels and actions
-            header = box.row(align=True)
+        layout.template_list(
+            "OSC_UL_GenericMappings", "", scn, "osc_generic_mappings",
+            scn, "osc_generic_mappings_active_index", rows=6,
+        )
 
-            icon = "TRIA_RIGHT" if item.fold else "TRIA_DOWN"
-            op = header.operator("osc_mapping.toggle_generic_fold", text="", icon=icon, emboss=False)
-            op.index = i
+        # Detailed editing UI for the active row only (when unfolded)
+        idx = scn.osc_generic_mappings_active_index
+        if 0 <= idx < len(scn.osc_generic_mappings):
+            item = scn.osc_generic_mappings[idx]
 
-            # Show OSC address and a short form of the data_path
-            header.label(text=item.address if item.address else "/param")
-            short_path = item.data_path.split('.')[-1] if item.data_path else "(Property)"
-            header.label(text=short_path)
-
-            # Duplicate and remove actions
-            header.operator("osc_mapping.duplicate_generic", text="", icon="DUPLICATE").index = i
-            header.operator("osc_mapping.remove_generic", text="", icon="X").index = i
-
-            # Detailed editing UI when not folded
             if not item.fold:
+                box = layout.box()
                 box.prop(item, "address")
                 box.prop(item, "data_path")
 
@@ -160,27 +314,62 @@ class OSC_PT_Panel_Extended(bpy.types.Panel):
         # Help / Tip box about right-click mapping
         # --------------------------------------------------------------
         box = layout.box()
-        box.label(text="💡 Tip: Right-click on any property", icon="INFO")
-        box.label(text="in Blender to create an OSC mapping!")
+        box.label(text=_TIP_LINE_1, icon="INFO")
+        box.label(text=_TIP_LINE_2)
 
 # ------------------------------------------------------------------------
 # Registration
 # ------------------------------------------------------------------------
 
 classes = (
+    OSC_UL_ShapeKeyMappings,
+    OSC_UL_GenericMappings,
     OSC_PT_Panel_Extended,
 )
 
 
+# Batched (un)registration functions generated by Blender
+_register_cls, _unregister_cls = bpy.utils.register_classes_factory(classes)
+
+# True while this module is registered; dev-reload cycles can call
+# register() twice and this skips the RNA "already registered" raise
+_registered = False
+
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    global _server_running, _registered
+
+    if _registered:
+        return
+
+    _register_cls()
+
+    # Coalesces redraw requests from OSC traffic to ~10 Hz
+    if not bpy.app.timers.is_registered(_flush_redraw):
+        bpy.app.timers.register(_flush_redraw, first_interval=_REDRAW_INTERVAL, persistent=True)
+
+    # Track server start/stop transitions instead of polling per draw
+    _server_running = osc_state.running
+    add_state_listener(_on_server_state)
+
+    _registered = True
 
 
 def unregister():
-    for cls in reversed(classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except:
-            # In case of partial registration in dev workflows
-            pass
+    global _registered
+
+    remove_state_listener(_on_server_state)
+
+    try:
+        bpy.app.timers.unregister(_flush_redraw)
+    except ValueError:
+        # Timer was not registered (partial enable/disable)
+        pass
+
+    try:
+        _unregister_cls()
+    except RuntimeError:
+        # In case of partial registration in dev workflows
+        pass
+
+    _registered = False